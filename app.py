@@ -1,10 +1,19 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 from flask_cors import CORS
 import threading
-import pandas as pd
+import io
 from datetime import datetime
 import os
+from exporters import EXPORT_FORMATS, STREAMING_FORMATS, iter_csv, iter_ndjson, missing_dependency, write_records
 from scraper import LinkedInScraper
+from job_queue import JobQueue
+from progress import ProgressLog, sse_stream
+from instrumentation import GLOBAL_METRICS
+from driver_factory import DriverPool
+from pacing import TokenBucket
+from results_store import ResultsStore
+from scheduler import Scheduler
+from selector_stats import SelectorStats
 
 app = Flask(__name__)
 CORS(app)
@@ -18,6 +27,122 @@ scraping_status = {
     'results': [],
     'error': False
 }
+progress_log = ProgressLog()
+
+# Logged-in sessions are saved here and reused by every scraper
+SESSION_FILE = os.environ.get('LINKEDIN_SESSION_FILE', 'linkedin_session.json')
+
+# When set, posts exported by earlier runs are skipped (cross-run deduplication)
+SEEN_INDEX_PATH = os.environ.get('SEEN_INDEX_PATH') or None
+
+# Every scraped post is stored here with its full text and can be searched through /posts
+RESULTS_DB = os.environ.get('RESULTS_DB', 'linkedin_results.db')
+results_store = ResultsStore(RESULTS_DB)
+
+# Hit rates and lookup times of the CSS selectors; scrapers try dead selectors
+# last, and /selector_stats shows LinkedIn markup drifting away from them
+SELECTOR_STATS_DB = os.environ.get('SELECTOR_STATS_DB', 'linkedin_selectors.db')
+selector_stats = SelectorStats(SELECTOR_STATS_DB)
+
+# Browser startup: headless needs a saved session, lean blocks images and media
+DRIVER_OPTIONS = {
+    'headless': os.environ.get('SCRAPER_HEADLESS', '0') == '1',
+    'lean': os.environ.get('SCRAPER_LEAN', '1') == '1',
+    'driver_path': os.environ.get('CHROMEDRIVER_PATH') or None
+}
+
+# Network-level blocking of images, media, fonts and trackers (see network_filter)
+FILTER_OPTIONS = {
+    'block_resources': os.environ.get('SCRAPER_BLOCK_RESOURCES', '1') == '1',
+    'resource_allowlist': [host.strip() for host in os.environ.get('SCRAPER_RESOURCE_ALLOWLIST', '').split(',') if host.strip()]
+}
+
+# Page actions (navigations and scrolls) of all scrapers share one rate limit, and a
+# backoff by one worker slows down the others too
+PACING_OPTIONS = {
+    'rate_limiter': TokenBucket(rate=float(os.environ.get('SCRAPER_ACTIONS_PER_MINUTE', 30)) / 60,
+                                burst=int(os.environ.get('SCRAPER_ACTION_BURST', 5))),
+    'action_budget': int(os.environ['SCRAPER_ACTION_BUDGET']) if os.environ.get('SCRAPER_ACTION_BUDGET') else None
+}
+
+# Preview every post first and expand only the new, in-window posts matching the
+# relevance pattern (a case-insensitive regex, e.g. "hiring|job opening")
+EXTRACTION_OPTIONS = {
+    'two_tier': os.environ.get('SCRAPER_TWO_TIER', '1') == '1',
+    'relevance_pattern': os.environ.get('SCRAPER_RELEVANCE_PATTERN') or None,
+    'selector_stats': SELECTOR_STATS_DB
+}
+
+# Keep a browser started ahead of time for /start_scraping and reuse it between runs
+driver_pool = None
+if os.environ.get('SCRAPER_PREWARM', '0') == '1':
+    driver_pool = DriverPool(size=1, **DRIVER_OPTIONS)
+
+# SCRAPER_ENGINE=async serves queued jobs as contexts of one Playwright browser
+engine_runner = None
+if os.environ.get('SCRAPER_ENGINE', 'selenium') == 'async':
+    from async_engine import AsyncScraperEngine, AsyncEngineRunner
+    engine_runner = AsyncEngineRunner(AsyncScraperEngine(
+        SESSION_FILE, headless=True, max_concurrent=int(os.environ.get('SCRAPER_CONTEXTS', 8)),
+        block_resources=FILTER_OPTIONS['block_resources'], resource_allowlist=FILTER_OPTIONS['resource_allowlist'],
+        rate_limiter=PACING_OPTIONS['rate_limiter'], seen_index=SEEN_INDEX_PATH, results_store=RESULTS_DB,
+        **EXTRACTION_OPTIONS))
+
+# Pool of long-lived browser workers serving queued jobs
+job_queue = JobQueue(
+    workers=int(os.environ.get('SCRAPER_WORKERS', 2)),
+    scraper_factory=lambda: LinkedInScraper(None, 0, 0, streaming=True, session_file=SESSION_FILE,
+                                            seen_index=SEEN_INDEX_PATH, results_store=RESULTS_DB,
+                                            **DRIVER_OPTIONS, **FILTER_OPTIONS, **PACING_OPTIONS,
+                                            **EXTRACTION_OPTIONS),
+    engine_runner=engine_runner
+)
+
+# Watched companies are re-scraped at an interval through the job queue; each run
+# stops scrolling at the newest post of the previous one
+scheduler = Scheduler(os.environ.get('SCHEDULE_DB', 'linkedin_schedule.db'), job_queue,
+                      check_interval=int(os.environ.get('SCHEDULER_CHECK_SECONDS', 30)))
+
+# Debug mode of `python app.py`; with it the reloader's parent process only watches
+# files and restarts the serving child (which has WERKZEUG_RUN_MAIN set)
+DEBUG = os.environ.get('FLASK_DEBUG', '1') == '1'
+
+def start_background_services():
+    """Resume the saved watches and start the pre-warmed browser"""
+    if os.environ.get('SCRAPER_SCHEDULER', '1') == '1':
+        scheduler.start()
+    if driver_pool:
+        driver_pool.warm()
+
+# Started when the app is created, e.g. by gunicorn, except in the reloader's parent
+if __name__ != '__main__' or not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    start_background_services()
+
+def parse_scrape_params(data):
+    """
+    Validate the scrape parameters of a request body
+    
+    Returns:
+        tuple: (company_name, days_filter, scroll_count, error) where error is None
+            or an error message
+    """
+    company_name = str(data.get('companyName', '')).strip()
+    days_filter = data.get('daysFilter', 7)
+    scroll_count = data.get('scrollCount', 50)
+    
+    if not company_name:
+        return None, None, None, 'Company name is required'
+    
+    try:
+        days_filter = int(days_filter)
+        scroll_count = int(scroll_count)
+    except (TypeError, ValueError):
+        return None, None, None, 'Invalid number format'
+    
+    if days_filter <= 0 or scroll_count <= 0:
+        return None, None, None, 'Days and scroll count must be positive'
+    
+    return company_name, days_filter, scroll_count, None
 
 @app.route('/')
 def home():
@@ -25,27 +150,15 @@ def home():
 
 @app.route('/start_scraping', methods=['POST'])
 def start_scraping():
-    global scraper, scraping_status
+    global scraper, scraping_status, progress_log
     
     if scraping_status['is_running']:
         return jsonify({'error': 'Scraping is already in progress'}), 400
     
     data = request.json
-    company_name = data.get('companyName', '').strip()
-    days_filter = data.get('daysFilter', 7)
-    scroll_count = data.get('scrollCount', 50)
-    
-    if not company_name:
-        return jsonify({'error': 'Company name is required'}), 400
-    
-    try:
-        days_filter = int(days_filter)
-        scroll_count = int(scroll_count)
-        
-        if days_filter <= 0 or scroll_count <= 0:
-            return jsonify({'error': 'Days and scroll count must be positive'}), 400
-    except ValueError:
-        return jsonify({'error': 'Invalid number format'}), 400
+    company_name, days_filter, scroll_count, error = parse_scrape_params(data)
+    if error:
+        return jsonify({'error': error}), 400
     
     scraping_status = {
         'is_running': True,
@@ -54,23 +167,49 @@ def start_scraping():
         'results': [],
         'error': False
     }
+    progress_log = ProgressLog()
+    events = progress_log
+    
+    def report_post(record):
+        # Partial results are available through /scraping_results while streaming
+        scraping_status['results'].append(record)
+        scraping_status['message'] = f"Scraping... {len(scraping_status['results'])} posts found so far"
+    
+    def report_progress(event):
+        if event['type'] == 'progress':
+            scraping_status['progress'] = event['progress']
+            scraping_status['message'] = event['message']
+        events.emit(event)
     
     def run_scraper():
         global scraper, scraping_status
         try:
-            scraper = LinkedInScraper(company_name, days_filter, scroll_count)
+            scraper = LinkedInScraper(company_name, days_filter, scroll_count,
+                                      streaming=True, on_post=report_post, on_progress=report_progress,
+                                      session_file=SESSION_FILE, seen_index=SEEN_INDEX_PATH,
+                                      results_store=RESULTS_DB, driver_pool=driver_pool,
+                                      **DRIVER_OPTIONS, **FILTER_OPTIONS, **PACING_OPTIONS,
+                                      **EXTRACTION_OPTIONS)
             results = scraper.run()
             
             scraping_status['results'] = results
+            scraping_status['scroll_stats'] = scraper.scroll_stats
+            scraping_status['metrics'] = scraper.metrics.snapshot()
             scraping_status['progress'] = 100
             scraping_status['message'] = f'Scraping complete! Found {len(results)} posts'
             scraping_status['is_running'] = False
+            events.emit({'type': 'finished', 'message': scraping_status['message'], 'posts': len(results)})
             
         except Exception as e:
             scraping_status['error'] = True
             scraping_status['message'] = f'Error: {str(e)}'
             scraping_status['is_running'] = False
             scraping_status['progress'] = 0
+            if scraper:
+                scraping_status['metrics'] = scraper.metrics.snapshot()
+            events.emit({'type': 'failed', 'message': scraping_status['message']})
+        finally:
+            events.close()
     
     thread = threading.Thread(target=run_scraper)
     thread.daemon = True
@@ -80,8 +219,161 @@ def start_scraping():
 
 @app.route('/scraping_status', methods=['GET'])
 def get_status():
+    """Compact status summary; the posts themselves are served by /scraping_results"""
     global scraping_status
-    return jsonify(scraping_status)
+    summary = {key: value for key, value in scraping_status.items() if key != 'results'}
+    summary['results_count'] = len(scraping_status['results'])
+    summary['cursor'] = progress_log.cursor
+    if scraping_status['is_running'] and scraper:
+        # Live per-phase timings and WebDriver call counts of the current run
+        summary['metrics'] = scraper.metrics.snapshot()
+    return jsonify(summary)
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Phase timings, WebDriver commands, sleeps and post latency of all runs in Prometheus format"""
+    return Response(GLOBAL_METRICS.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/selector_stats', methods=['GET'])
+def get_selector_stats():
+    """Hit rate, average lookup time and dead flag of every selector, per group"""
+    return jsonify({'groups': selector_stats.snapshot()})
+
+@app.route('/scraping_results', methods=['GET'])
+def get_results():
+    """Results of the current run, optionally only those after ?offset=N"""
+    global scraping_status
+    offset = request.args.get('offset', 0, type=int)
+    results = scraping_status['results']
+    return jsonify({'results': results[offset:], 'total': len(results)})
+
+@app.route('/posts', methods=['GET'])
+def search_posts():
+    """
+    Search the stored posts of all runs without scraping again
+    
+    Query parameters: company, q (words that must appear in the post text),
+    days, page and per_page (at most 200)
+    """
+    days = request.args.get('days', type=int)
+    page = request.args.get('page', 1, type=int)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 200)
+    return jsonify(results_store.query(company=request.args.get('company') or None,
+                                       text=request.args.get('q') or None,
+                                       days=days, page=page, per_page=per_page))
+
+@app.route('/scraping_events', methods=['GET'])
+def get_events():
+    return events_response(progress_log)
+
+def events_response(log):
+    """
+    Serve progress events after the Last-Event-ID header (or ?cursor=N)
+    
+    Streams Server-Sent Events by default; with ?mode=poll the request is held
+    until a newer event arrives (long-poll) and returns the events as JSON.
+    """
+    # EventSource reconnects with the original URL plus Last-Event-ID, so the
+    # header wins; a malformed one falls back to the query cursor or the start
+    cursor = request.headers.get('Last-Event-ID', type=int)
+    if cursor is None:
+        cursor = request.args.get('cursor', 0, type=int)
+    
+    if request.args.get('mode') == 'poll':
+        timeout = min(request.args.get('timeout', 25, type=float), 60)
+        events = log.since(cursor, timeout=timeout)
+        return jsonify({
+            'events': events,
+            'cursor': events[-1]['id'] if events else cursor,
+            'closed': log.closed
+        })
+    
+    return Response(stream_with_context(sse_stream(log, cursor)), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/jobs', methods=['POST'])
+def submit_jobs():
+    """Queue one job per company; accepts either companyName or a companies list"""
+    data = request.json or {}
+    companies = data.get('companies')
+    if companies is not None and (not isinstance(companies, list)
+                                  or not all(isinstance(company, str) for company in companies)):
+        return jsonify({'error': 'companies must be a list of company names'}), 400
+    companies = companies or [data.get('companyName', '')]
+    
+    jobs = []
+    for company in companies:
+        params = dict(data, companyName=company)
+        company_name, days_filter, scroll_count, error = parse_scrape_params(params)
+        if error:
+            return jsonify({'error': f'{error} ({company!r})'}), 400
+        jobs.append((company_name, days_filter, scroll_count))
+    
+    submitted = [job_queue.submit(*job).to_dict() for job in jobs]
+    return jsonify({'success': True, 'jobs': submitted}), 202
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    return jsonify({'jobs': [job.to_dict() for job in job_queue.list_jobs()]})
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def get_job_events(job_id):
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return events_response(job.events)
+
+@app.route('/jobs/<job_id>/results', methods=['GET'])
+def get_job_results(job_id):
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict(include_results=True))
+
+@app.route('/jobs/<job_id>/export', methods=['GET'])
+def export_job_results(job_id):
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    if not job.results:
+        return jsonify({'error': 'No results to export'}), 400
+    return export_response(list(job.results), request.args.get('format', 'xlsx'))
+
+@app.route('/watches', methods=['GET'])
+def list_watches():
+    return jsonify({'watches': scheduler.watches()})
+
+@app.route('/watches', methods=['POST'])
+def add_watch():
+    """Scrape a company every intervalMinutes, starting now"""
+    data = request.json or {}
+    company_name, days_filter, scroll_count, error = parse_scrape_params(data)
+    if error:
+        return jsonify({'error': error}), 400
+    
+    try:
+        interval_minutes = int(data.get('intervalMinutes', 60))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid number format'}), 400
+    if interval_minutes <= 0:
+        return jsonify({'error': 'Interval must be positive'}), 400
+    
+    watch = scheduler.watch(company_name, interval_minutes, days_filter, scroll_count)
+    scheduler.start()
+    return jsonify({'success': True, 'watch': watch}), 201
+
+@app.route('/watches/<company>', methods=['DELETE'])
+def remove_watch(company):
+    if not scheduler.unwatch(company):
+        return jsonify({'error': 'Watch not found'}), 404
+    return jsonify({'success': True})
 
 @app.route('/export_results', methods=['GET'])
 def export_results():
@@ -90,20 +382,34 @@ def export_results():
     if not scraping_status['results']:
         return jsonify({'error': 'No results to export'}), 400
     
+    return export_response(list(scraping_status['results']), request.args.get('format', 'xlsx'))
+
+def export_response(results, fmt):
+    """Build a download response for the results in the requested format"""
+    fmt = fmt.lower()
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unsupported format '{fmt}', use one of: {', '.join(EXPORT_FORMATS)}"}), 400
+    missing = missing_dependency(fmt)
+    if missing:
+        return jsonify({'error': missing}), 501
+    
+    mimetype, extension = EXPORT_FORMATS[fmt]
+    filename = f"linkedin_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    
     try:
-        df = pd.DataFrame(scraping_status['results'])
-        
-        filename = f"linkedin_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        filepath = os.path.join('exports', filename)
-        
-        os.makedirs('exports', exist_ok=True)
-        
-        df.to_excel(filepath, index=False)
+        if fmt in STREAMING_FORMATS:
+            # Generated row by row, nothing is written to disk
+            rows = iter_csv(results) if fmt == 'csv' else iter_ndjson(results)
+            return Response(stream_with_context(rows), mimetype=mimetype,
+                            headers={'Content-Disposition': f'attachment; filename={filename}'})
         
-        return send_file(filepath, as_attachment=True, download_name=filename)
+        buffer = io.BytesIO()
+        write_records(results, buffer, fmt)
+        buffer.seek(0)
+        return send_file(buffer, mimetype=mimetype, as_attachment=True, download_name=filename)
         
     except Exception as e:
         return jsonify({'error': f'Export failed: {str(e)}'}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    app.run(debug=DEBUG, port=5000)
\ No newline at end of file
@@ -0,0 +1,407 @@
+"""
+Asyncio scraping engine that serves many jobs from one browser process
+
+Every job gets its own lightweight Playwright browser context (separate
+cookies, cache and pages) built from the session saved by the Selenium
+scraper, so a job costs a few tabs instead of a whole Chrome process. The
+phases, injected scripts and record building are the ones of LinkedInScraper.
+
+Requires the optional playwright package (pip install playwright, then
+playwright install chromium).
+"""
+import asyncio
+import fnmatch
+import json
+import os
+import threading
+import time
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+from network_filter import DEFAULT_BLOCKED_CATEGORIES, blocked_url_patterns
+from pacing import THROTTLE_STATE_SCRIPT
+from seen_index import SeenIndex
+from results_store import ResultsStore
+from selector_stats import SelectorStats
+from scraper import (LinkedInScraper, POST_SELECTORS, TEXT_SELECTORS, TIME_KEYWORDS, SEE_MORE_SELECTORS,
+                     SCROLL_SETTLE_MS, SEARCH_URL_TEMPLATES, SEARCH_RESULT_SELECTORS, SEARCH_EMPTY_SELECTORS,
+                     SEARCH_STATE_SCRIPT, EXPAND_SEE_MORE_SCRIPT, EXTRACT_POSTS_SCRIPT, SCROLL_AND_WAIT_SCRIPT)
+
+# Playwright resource types covered by the network_filter categories
+BLOCKED_RESOURCE_TYPES = {
+    "images": {"image"},
+    "media": {"media"},
+    "fonts": {"font"}
+}
+
+_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
+def _wrap_script(script, is_async=False):
+    """Turn a WebDriver script that reads arguments[i] into a Playwright function"""
+    if is_async:
+        # The last argument of an async WebDriver script is its completion callback
+        return f"(args) => new Promise((done) => (function() {{ {script} }}).apply(null, args.concat([done])))"
+    return f"(args) => (function() {{ {script} }}).apply(null, args)"
+
+
+SEARCH_STATE_FUNCTION = _wrap_script(SEARCH_STATE_SCRIPT)
+EXPAND_SEE_MORE_FUNCTION = _wrap_script(EXPAND_SEE_MORE_SCRIPT)
+EXTRACT_POSTS_FUNCTION = _wrap_script(EXTRACT_POSTS_SCRIPT)
+SCROLL_AND_WAIT_FUNCTION = _wrap_script(SCROLL_AND_WAIT_SCRIPT, is_async=True)
+THROTTLE_STATE_FUNCTION = _wrap_script(THROTTLE_STATE_SCRIPT)
+
+
+def storage_state_from_session(session_file):
+    """
+    Convert a session saved by LinkedInScraper.save_session to a Playwright storage state
+
+    Args:
+        session_file (str): JSON file with cookies and local storage
+
+    Returns:
+        dict: The storage state, or None if the file does not exist
+    """
+    if not session_file or not os.path.exists(session_file):
+        return None
+    with open(session_file, encoding="utf-8") as f:
+        session = json.load(f)
+
+    cookies = []
+    for cookie in session.get("cookies", []):
+        converted = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain", ".linkedin.com"),
+            "path": cookie.get("path", "/"),
+            "expires": cookie.get("expiry", -1),
+            "httpOnly": cookie.get("httpOnly", False),
+            "secure": cookie.get("secure", False)
+        }
+        same_site = _SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+        if same_site:
+            converted["sameSite"] = same_site
+        cookies.append(converted)
+
+    local_storage = [{"name": key, "value": value} for key, value in session.get("local_storage", {}).items()]
+    return {
+        "cookies": cookies,
+        "origins": [{"origin": "https://www.linkedin.com", "localStorage": local_storage}] if local_storage else []
+    }
+
+
+class AsyncScraperEngine:
+    def __init__(self, session_file, headless=True, max_concurrent=8, block_resources=True,
+                 resource_allowlist=None, rate_limiter=None, seen_index=None, search_urls=None,
+                 search_timeout=15, scroll_timeout=10, max_idle_scrolls=3, results_store=None,
+                 two_tier=True, relevance_pattern=None, selector_stats=None, prune_dom=True):
+        """
+        One browser process serving many concurrent scrape jobs
+
+        Args:
+            session_file (str): Session saved by LinkedInScraper; required, since
+                there is no window for a manual login
+            headless (bool): Run the browser without a window
+            max_concurrent (int): Jobs (browser contexts) running at the same time
+            block_resources (bool or list): Abort image, media, font and tracking
+                requests; a list selects the categories of network_filter
+            resource_allowlist (list): Hosts or URL fragments that are never blocked
+            rate_limiter (TokenBucket): Page-action rate limit shared with other scrapers
+            seen_index (str): SQLite file of posts exported by earlier runs
+            search_urls (list): Search URL templates (defaults to SEARCH_URL_TEMPLATES)
+            search_timeout (int): Seconds to wait for the search pages to show results
+            scroll_timeout (int): Seconds to wait for new posts after a scroll
+            max_idle_scrolls (int): Consecutive scrolls without growth before the feed
+                is considered exhausted
+            results_store (str): SQLite file where every extracted post is stored
+            two_tier (bool): Expand and fully read only the posts that pass a preview
+            relevance_pattern (str or list): Regex or keywords a post's text must match
+            selector_stats (str): SQLite file of per-selector hit rates, shared by all jobs
+            prune_dom (bool): Empty already processed post nodes so long feeds stay light
+        """
+        self.session_file = session_file
+        self.headless = headless
+        self.max_concurrent = max_concurrent
+        if block_resources is True:
+            block_resources = DEFAULT_BLOCKED_CATEGORIES
+        self.blocked_categories = list(block_resources or [])
+        self.blocked_patterns = blocked_url_patterns(self.blocked_categories, resource_allowlist)
+        self.blocked_types = set().union(*(BLOCKED_RESOURCE_TYPES.get(c, set()) for c in self.blocked_categories))
+        self.resource_allowlist = [entry.lower() for entry in (resource_allowlist or [])]
+        self.rate_limiter = rate_limiter
+        self.seen_index = SeenIndex(seen_index) if seen_index else None
+        self.results_store = ResultsStore(results_store) if results_store else None
+        self.selector_stats = SelectorStats(selector_stats) if selector_stats else None
+        self.search_urls = search_urls or SEARCH_URL_TEMPLATES
+        self.search_timeout = search_timeout
+        self.scroll_timeout = scroll_timeout
+        self.max_idle_scrolls = max_idle_scrolls
+        self.prune_dom = prune_dom
+        self.two_tier = two_tier
+        self.relevance_pattern = relevance_pattern
+        self._playwright = None
+        self._browser = None
+        self._slots = None
+        self._start_lock = None
+
+    async def start(self):
+        """Launch the shared browser, unless it is running already"""
+        if async_playwright is None:
+            raise RuntimeError("The async engine requires playwright (pip install playwright)")
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._browser:
+                return
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+
+    async def close(self):
+        """Close the browser and every context"""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def scrape(self, mention, time_filter, scroll_count, on_post=None, on_progress=None,
+                     high_water_mark=None, metrics=None):
+        """
+        Search, scroll and extract the posts of one company in its own context
+
+        Args:
+            mention (str): Company name to search for
+            time_filter (int): Number of days to filter posts
+            scroll_count (int): Maximum number of scrolls
+            on_post (callable): Called with each record as soon as it is extracted
+            on_progress (callable): Called with a progress event dict per phase,
+                scroll and post (from the engine's event loop thread)
+            high_water_mark (dict): urn and date of the newest post of an earlier run
+            metrics (Instrumentation): Receives the phase times and post latency of the job
+
+        Returns:
+            list: The extracted post records
+        """
+        await self.start()
+
+        # The scraper has no driver: it only holds the run state and builds the records
+        scraper = LinkedInScraper(mention, time_filter, scroll_count, streaming=True, prune_dom=self.prune_dom,
+                                  on_post=on_post, on_progress=on_progress, rate_limiter=self.rate_limiter,
+                                  max_idle_scrolls=self.max_idle_scrolls, search_urls=self.search_urls,
+                                  two_tier=self.two_tier, relevance_pattern=self.relevance_pattern)
+        if metrics is not None:
+            scraper.metrics = metrics
+        scraper.seen_index = self.seen_index
+        scraper.results_store = self.results_store
+        scraper.selector_stats = self.selector_stats
+        scraper._begin_run(high_water_mark=high_water_mark)
+
+        scraper._report_phase("setup", 0, "Waiting for a free browser context...")
+        async with self._slots:
+            context = await self._new_context()
+            try:
+                scraper._report_phase("search", 10, f"Searching for mentions of {mention}...")
+                with scraper.metrics.phase("search"):
+                    page = await self._search(context, scraper)
+                await self._scroll_and_extract(page, scraper)
+            finally:
+                await context.close()
+
+        return scraper._finish_run(scraper.posts_data)
+
+    async def _new_context(self):
+        """Create an isolated context logged in with the saved session"""
+        storage_state = storage_state_from_session(self.session_file)
+        if storage_state is None:
+            raise RuntimeError(f"No saved session at {self.session_file}; log in once with the browser scraper first")
+
+        context = await self._browser.new_context(storage_state=storage_state,
+                                                  viewport={"width": 1366, "height": 900})
+        if self.blocked_categories:
+            await context.route("**/*", self._filter_request)
+        return context
+
+    async def _filter_request(self, route):
+        """Abort blocked resource types and URLs, continue everything else"""
+        request = route.request
+        url = request.url.lower()
+        if not any(entry in url for entry in self.resource_allowlist):
+            if request.resource_type in self.blocked_types or any(
+                    fnmatch.fnmatchcase(url, pattern) for pattern in self.blocked_patterns):
+                await route.abort()
+                return
+        await route.continue_()
+
+    async def _pace(self, scraper, kind):
+        wait = scraper.pacer.reserve(kind)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _check_throttle(self, page, scraper):
+        """Back off on throttling signals (raises ThrottledError on a challenge)"""
+        try:
+            state = await page.evaluate(THROTTLE_STATE_FUNCTION, []) or {}
+        except Exception:
+            return False
+        reason = scraper.pacer.throttle_reason(state)
+        if not reason:
+            return False
+        await asyncio.sleep(scraper.pacer.backoff_delay(reason))
+        return True
+
+    async def _search(self, context, scraper):
+        """Load the search URLs side by side and return the page of the best one"""
+        print(f"\nSearching for mentions: @{scraper.mention}")
+        search_urls = scraper._search_urls()
+
+        while True:
+            started = time.time()
+            pages = []
+            for search_url in search_urls:
+                await self._pace(scraper, "search")
+                pages.append(await context.new_page())
+            await asyncio.gather(*(page.goto(url, wait_until="domcontentloaded")
+                                   for page, url in zip(pages, search_urls)), return_exceptions=True)
+
+            winner, found = await self._pick_search_page(pages)
+            for page in pages:
+                if page is not winner:
+                    await page.close()
+
+            if found:
+                print(f"Successfully found results")
+                scraper.pacer.observe("search", time.time() - started)
+                scraper.pacer.recover()
+                return winner
+            if not await self._check_throttle(winner, scraper):
+                print("Warning: May not have found optimal search results. Proceeding...")
+                return winner
+            await winner.close()
+
+    async def _pick_search_page(self, pages):
+        """
+        Wait for the most preferred page with results
+
+        Returns:
+            tuple: (page, whether it shows results)
+        """
+        deadline = time.time() + self.search_timeout
+        states = {}
+        while True:
+            for index, page in enumerate(pages):
+                if states.get(index) not in ("results", "empty"):
+                    try:
+                        states[index] = await page.evaluate(
+                            SEARCH_STATE_FUNCTION, [SEARCH_RESULT_SELECTORS, SEARCH_EMPTY_SELECTORS])
+                    except Exception:
+                        states[index] = "loading"
+                if states[index] == "results":
+                    return page, True
+                if states[index] != "empty":
+                    break
+            else:
+                return pages[0], False
+
+            if time.time() > deadline:
+                best = next((i for i in range(len(pages)) if states.get(i) == "results"), 0)
+                return pages[best], states.get(best) == "results"
+            await asyncio.sleep(0.3)
+
+    async def _expand(self, page, scraper, post_ids=None):
+        """Expand 'See more' sections; with two-tier extraction only inside post_ids"""
+        if scraper.two_tier and post_ids is None:
+            return 0
+        try:
+            result = await page.evaluate(EXPAND_SEE_MORE_FUNCTION,
+                                         [scraper._selectors("see_more", SEE_MORE_SELECTORS),
+                                          None, list(scraper.known_on_page), post_ids]) or {}
+            scraper._record_selectors(result)
+            return result.get("count", 0)
+        except Exception as e:
+            print(f"Could not expand 'See more' sections: {e}")
+            return 0
+
+    async def _extract_new(self, page, scraper):
+        options = {"onlyNew": True, "prune": scraper.prune_dom, "includeHtml": False, "tagIds": scraper.two_tier}
+        with scraper.metrics.phase("extract"):
+            result = scraper.drop_known(await self._run_extract(page, scraper, options))
+            posts = result.get("posts") or []
+            if scraper.two_tier:
+                posts = scraper._preview_candidates(posts)
+                if posts:
+                    ids = [item["id"] for item in posts]
+                    await self._expand(page, scraper, ids)
+                    deep = await self._run_extract(page, scraper, {"ids": ids})
+                    posts = scraper._merge_deep(posts, deep.get("posts") or [])
+            return scraper._process_payload(posts)
+
+    async def _run_extract(self, page, scraper, options):
+        result = await page.evaluate(EXTRACT_POSTS_FUNCTION, [scraper._selectors("post", POST_SELECTORS),
+                                                              scraper._selectors("text", TEXT_SELECTORS),
+                                                              TIME_KEYWORDS, options]) or {}
+        scraper._record_selectors(result)
+        return result
+
+    async def _scroll_and_extract(self, page, scraper):
+        """Scroll until the feed is exhausted or out of the time window, extracting new posts each time"""
+        print(f"\nScrolling and streaming posts (up to {scraper.scroll_count} times)...")
+        scraper.begin_scrolling()
+
+        for i in range(scraper.scroll_count):
+            with scraper.metrics.phase("scroll"):
+                await self._pace(scraper, "scroll")
+                scroll_started = time.time()
+                state = await page.evaluate(SCROLL_AND_WAIT_FUNCTION, [scraper._selectors("post", POST_SELECTORS),
+                                                                       TIME_KEYWORDS, self.scroll_timeout * 1000,
+                                                                       SCROLL_SETTLE_MS]) or {}
+                scraper.report_scroll(i, state.get("count", 0))
+                await self._expand(page, scraper)
+            await self._extract_new(page, scraper)
+
+            throttled = not state.get("grew") and await self._check_throttle(page, scraper)
+            if scraper.after_scroll(state, time.time() - scroll_started, throttled):
+                break
+
+        await self._expand(page, scraper)
+        await self._extract_new(page, scraper)
+        scraper.finish_scrolling()
+
+
+class AsyncEngineRunner:
+    def __init__(self, engine):
+        """
+        Runs an AsyncScraperEngine on an event loop in a background thread, so
+        synchronous code (Flask views, the job queue) can submit jobs to it
+
+        Args:
+            engine (AsyncScraperEngine): The engine to run
+        """
+        self.engine = engine
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine):
+        """
+        Schedule a coroutine on the engine's loop
+
+        Returns:
+            concurrent.futures.Future: Resolves to the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def scrape(self, mention, time_filter, scroll_count, on_post=None, on_progress=None, high_water_mark=None,
+               metrics=None):
+        """Start a scrape and return a future of its records"""
+        return self.submit(self.engine.scrape(mention, time_filter, scroll_count, on_post, on_progress,
+                                              high_water_mark, metrics))
+
+    def close(self):
+        """Close the engine and stop the loop"""
+        self.submit(self.engine.close()).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,199 @@
+"""
+Offline benchmark of the LinkedInScraper phases against the synthetic feed
+
+Runs the scraper's page phases (load, scroll_and_load, extract_posts) against
+benchmarks/fixture_server.py in a local headless Chrome and records per phase
+wall time, WebDriver command counts and memory. Results are written as JSON so
+two commits can be compared:
+
+    python benchmarks/bench_scraper.py --output before.json
+    python benchmarks/bench_scraper.py --output after.json --compare before.json
+
+By default extract_posts is the two-tier path the scraper runs: a preview of
+every post, then 'See more' expansion and a full read of the survivors only.
+--legacy-expand benchmarks the single-tier path instead, with its blanket
+expand_see_more_sections phase before the extraction.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from scraper import LinkedInScraper
+from fixture_server import start_server
+
+DEFAULT_SIZES = [50, 500, 5000]
+
+
+def command_counts(metrics):
+    """Total WebDriver commands sent so far, by command, across all scraper phases"""
+    counts = {}
+    for phase in metrics.snapshot()["phases"].values():
+        for command, count in phase["webdriver_commands"].items():
+            counts[command] = counts.get(command, 0) + count
+    return counts
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_driver():
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1366,900")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    return webdriver.Chrome(options=options)
+
+
+def run_benchmark(base_url, posts, batch, extraction_mode, days, two_tier=True):
+    """Benchmark one feed size and extraction mode, returning the phase measurements"""
+    phases = {}
+
+    started = time.perf_counter()
+    driver = make_driver()
+    phases["setup_driver"] = {"seconds": time.perf_counter() - started}
+
+    scraper = LinkedInScraper("fixture", days, math.ceil(posts / batch) + 3,
+                              extraction_mode=extraction_mode, scroll_timeout=5, two_tier=two_tier)
+    scraper.driver = scraper.metrics.attach(driver)
+
+    def measure(name, func):
+        before = command_counts(scraper.metrics)
+        tracemalloc.start()
+        phase_started = time.perf_counter()
+        with scraper.metrics.phase(name):
+            result = func()
+        seconds = time.perf_counter() - phase_started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        commands = {command: count - before.get(command, 0)
+                    for command, count in command_counts(scraper.metrics).items()
+                    if count > before.get(command, 0)}
+        phases[name] = {
+            "seconds": seconds,
+            "webdriver_calls": sum(commands.values()),
+            "webdriver_commands": commands,
+            "python_peak_mb": peak / 1e6
+        }
+        return result
+
+    try:
+        measure("load", lambda: driver.get(f"{base_url}/search/results/content/?posts={posts}&batch={batch}"))
+        measure("scroll_and_load", scraper.scroll_and_load)
+        if not two_tier:
+            measure("expand_see_more_sections", scraper.expand_see_more_sections)
+        records = measure("extract_posts", scraper.extract_posts)
+
+        scraper_metrics = scraper.metrics.snapshot()
+        js_heap = driver.execute_script(
+            "return performance.memory ? performance.memory.usedJSHeapSize : null;")
+        loaded = driver.execute_script("return document.querySelectorAll('[data-urn]').length;")
+    finally:
+        driver.quit()
+
+    return {
+        "posts": posts,
+        "extraction_mode": extraction_mode,
+        "two_tier": two_tier,
+        "posts_loaded": loaded,
+        "records": len(records),
+        "js_heap_mb": js_heap / 1e6 if js_heap else None,
+        "total_seconds": sum(phase["seconds"] for phase in phases.values()),
+        "total_webdriver_calls": sum(phase.get("webdriver_calls", 0) for phase in phases.values()),
+        "phases": phases,
+        "extraction_stats": scraper.extraction_stats,
+        "scraper_metrics": scraper_metrics
+    }
+
+
+def compare(results, baseline):
+    """Print the change of every phase against a baseline results file"""
+    # Baselines from before the two-tier path only have the single-tier runs
+    previous = {(r["posts"], r["extraction_mode"], r.get("two_tier", False)): r for r in baseline["runs"]}
+    print(f"\nComparison with {baseline.get('revision') or 'baseline'}:")
+    for run in results["runs"]:
+        old = previous.get((run["posts"], run["extraction_mode"], run["two_tier"]))
+        if not old:
+            continue
+        print(f"\n{run['posts']} posts ({run_label(run)}):")
+        for name, phase in run["phases"].items():
+            old_phase = old["phases"].get(name)
+            if not old_phase:
+                continue
+            delta = phase["seconds"] - old_phase["seconds"]
+            percent = 100 * delta / old_phase["seconds"] if old_phase["seconds"] else 0
+            calls = phase.get("webdriver_calls", 0) - old_phase.get("webdriver_calls", 0)
+            print(f"  {name:<26} {phase['seconds']:8.2f}s  {delta:+8.2f}s ({percent:+6.1f}%)  "
+                  f"calls {calls:+d}")
+
+
+def run_label(run):
+    return run["extraction_mode"] + ("" if run["two_tier"] else ", legacy expand")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LinkedInScraper against a synthetic feed")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Feed sizes in posts")
+    parser.add_argument("--modes", nargs="+", default=["script"],
+                        choices=["script", "snapshot", "elements"], help="Extraction modes to run")
+    parser.add_argument("--batch", type=int, default=50, help="Posts loaded per infinite-scroll request")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per infinite-scroll request")
+    parser.add_argument("--days", type=int, default=365, help="Time filter in days")
+    parser.add_argument("--legacy-expand", action="store_true",
+                        help="Benchmark single-tier extraction with a blanket 'See more' expansion")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Results file of an earlier run to compare against")
+    args = parser.parse_args()
+
+    server = start_server(latency=args.latency, batch=args.batch)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": []
+    }
+    try:
+        for posts in args.sizes:
+            for mode in args.modes:
+                print(f"\n=== {posts} posts, {mode} extraction{', legacy expand' if args.legacy_expand else ''} ===")
+                run = run_benchmark(base_url, posts, args.batch, mode, args.days, two_tier=not args.legacy_expand)
+                results["runs"].append(run)
+                print(f"{run['records']} records in {run['total_seconds']:.2f}s, "
+                      f"{run['total_webdriver_calls']} WebDriver calls")
+    finally:
+        server.shutdown()
+
+    print("\nSummary:")
+    for run in results["runs"]:
+        phases = "  ".join(f"{name}={phase['seconds']:.2f}s" for name, phase in run["phases"].items())
+        print(f"{run['posts']:>6} posts {run_label(run):<25} {phases}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Local HTTP server that serves a synthetic LinkedIn search results feed
+
+The page uses the class names and data-urn attributes the scraper targets,
+loads more posts when scrolled to the bottom (infinite scroll) and hides long
+post texts behind collapsed "see more" buttons.
+
+    python benchmarks/fixture_server.py --port 8765
+    open http://127.0.0.1:8765/search/results/content/?posts=500
+"""
+import argparse
+import html
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+WORDS = ("hiring engineer python data analyst remote team role apply experience "
+         "opportunity cloud backend frontend product growth join us location salary "
+         "interview skills project startup scale platform mentor").split()
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Search results | LinkedIn fixture</title>
+<style>
+.feed-shared-update-v2 {{ border: 1px solid #ddd; margin: 12px; padding: 12px; min-height: 140px; }}
+.visually-hidden {{ position: absolute; width: 1px; height: 1px; overflow: hidden; clip: rect(0 0 0 0); }}
+</style>
+</head>
+<body>
+<nav class="global-nav">LinkedIn fixture</nav>
+<main><div id="feed">{posts}</div></main>
+<script>
+let offset = {offset};
+const total = {total};
+const batch = {batch};
+let loading = false;
+
+window.addEventListener("scroll", async () => {{
+    if (loading || offset >= total) return;
+    if (window.innerHeight + window.scrollY < document.body.scrollHeight - 300) return;
+    loading = true;
+    const response = await fetch(`/posts?offset=${{offset}}&count=${{batch}}&total=${{total}}`);
+    document.getElementById("feed").insertAdjacentHTML("beforeend", await response.text());
+    offset += batch;
+    loading = false;
+}});
+
+document.addEventListener("click", (e) => {{
+    const button = e.target.closest(".feed-shared-inline-show-more-text__see-more-less-toggle");
+    if (!button) return;
+    const text = button.closest("[data-urn]").querySelector(".update-components-text");
+    const expanded = button.getAttribute("aria-expanded") === "true";
+    text.textContent = expanded ? text.dataset.short : text.dataset.full;
+    button.setAttribute("aria-expanded", String(!expanded));
+    button.textContent = expanded ? "…see more" : "see less";
+}});
+</script>
+</body>
+</html>
+"""
+
+POST_TEMPLATE = """<div class="feed-shared-update-v2" data-urn="urn:li:activity:{activity_id}">
+  <div class="update-components-actor"><a href="/in/member-{index}">Member {index}</a>
+    <span aria-hidden="true">{short_time} • </span><span class="visually-hidden">{long_time}</span>
+  </div>
+  <div class="update-components-text" data-short="{short_text}" data-full="{full_text}">{short_text}</div>
+  <button class="feed-shared-inline-show-more-text__see-more-less-toggle" aria-expanded="false"
+          aria-label="see more, visually reveals content which is already detected by screen readers">…see more</button>
+  <a href="/feed/update/urn:li:activity:{activity_id}/">Comment</a>
+</div>
+"""
+
+
+def _relative_time(hours):
+    """Format an age like LinkedIn does: short form and the screen-reader form"""
+    if hours < 24:
+        return f"{hours}h", f"{hours} hour{'s' if hours != 1 else ''} ago"
+    days = hours // 24
+    if days < 7:
+        return f"{days}d", f"{days} day{'s' if days != 1 else ''} ago"
+    if days < 30:
+        weeks = days // 7
+        return f"{weeks}w", f"{weeks} week{'s' if weeks != 1 else ''} ago"
+    months = days // 30
+    return f"{months}mo", f"{months} month{'s' if months != 1 else ''} ago"
+
+
+def render_post(index, total):
+    """Render post number index of a feed with total posts (deterministic)"""
+    rng = random.Random(index)
+    words = [rng.choice(WORDS) for _ in range(rng.randint(40, 160))]
+    if index % 3 == 0:
+        words.insert(rng.randint(0, len(words)), f"careers{index}@example.com")
+    if index % 5 == 0:
+        words.insert(rng.randint(0, len(words)), f"+91 98{index:08d}"[:16])
+    full_text = " ".join(words)
+
+    # Ages spread evenly over 60 days so any time window cuts the feed
+    short_time, long_time = _relative_time(max(1, index * 60 * 24 // max(total, 1)))
+    return POST_TEMPLATE.format(
+        activity_id=7000000000000000000 + index,
+        index=index,
+        short_time=short_time,
+        long_time=long_time,
+        short_text=html.escape(full_text[:180] + "…"),
+        full_text=html.escape(full_text)
+    )
+
+
+def render_posts(offset, count, total):
+    return "".join(render_post(i, total) for i in range(offset, min(offset + count, total)))
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    latency = 0.3
+    batch = 10
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        total = int(query.get("posts", query.get("total", 50)))
+        batch = int(query.get("batch", self.batch))
+
+        if url.path.startswith("/search/results"):
+            body = PAGE_TEMPLATE.format(posts=render_posts(0, batch, total), offset=batch,
+                                        total=total, batch=batch)
+        elif url.path == "/posts":
+            # Simulated server latency of LinkedIn's infinite scroll requests
+            time.sleep(self.latency)
+            body = render_posts(int(query.get("offset", 0)), int(query.get("count", batch)), total)
+        else:
+            self.send_error(404)
+            return
+
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port=0, latency=0.3, batch=10):
+    """
+    Start the fixture server in a background thread
+
+    Returns:
+        ThreadingHTTPServer: The running server; its URL is
+            f"http://127.0.0.1:{server.server_port}"
+    """
+    handler = type("Handler", (FixtureHandler,), {"latency": latency, "batch": batch})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic LinkedIn search results feed")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds per infinite-scroll request")
+    parser.add_argument("--batch", type=int, default=10, help="Posts per infinite-scroll request")
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.latency, args.batch)
+    print(f"Serving on http://127.0.0.1:{server.server_port}/search/results/content/?posts=500")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import os
+import re
+from datetime import datetime
+from exporters import EXPORT_FORMATS, missing_dependency, write_records
+from scraper import LinkedInScraper
+
+
+def load_companies(path):
+    """Read one company name per line, skipping blank lines and # comments"""
+    with open(path, encoding='utf-8') as f:
+        lines = (line.split('#', 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
+def export_filename(mention, fmt, output_dir='.'):
+    """Return a timestamped export path for one company"""
+    safe_name = re.sub(r'[^\w.-]+', '_', mention).strip('_') or 'company'
+    extension = EXPORT_FORMATS[fmt][1]
+    return os.path.join(output_dir, f"linkedin_{safe_name}_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}")
+
+
+def run_batch(companies, days, scrolls, fmt, output_dir='.', **scraper_options):
+    """
+    Scrape several companies with one browser and one logged-in session
+
+    Args:
+        companies (list): Company names to search for, in order
+        days (int): Number of days to filter posts
+        scrolls (int): Maximum number of scrolls per company
+        fmt (str): Export format, a key of EXPORT_FORMATS
+        output_dir (str): Directory of the export files
+        **scraper_options: Further LinkedInScraper arguments
+
+    Returns:
+        dict: Export path (or None when nothing was found) per company
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    scraper = None
+    exports = {}
+    try:
+        for i, company in enumerate(companies):
+            print(f"\n{'=' * 60}\n[{i + 1}/{len(companies)}] {company}\n{'=' * 60}")
+            exports[company] = None
+            try:
+                if scraper is None:
+                    scraper = LinkedInScraper(None, days, scrolls, **scraper_options)
+                    scraper.start()
+                records = scraper.scrape(company, days, scrolls)
+            except Exception as e:
+                print(f"Scraping {company} failed: {e}")
+                # The browser may be unusable; the next company starts a fresh one
+                if scraper:
+                    try:
+                        scraper.close()
+                    except Exception:
+                        pass
+                    scraper = None
+                continue
+
+            if not records:
+                print("\nNo posts found matching the criteria")
+                continue
+
+            path = export_filename(company, fmt, output_dir)
+            try:
+                write_records(records, path, fmt)
+            except Exception as e:
+                print(f"Exporting {company} failed: {e}")
+                continue
+            exports[company] = path
+            print(f"Saved {len(records)} posts to {os.path.abspath(path)}")
+    finally:
+        if scraper:
+            scraper.close()
+    return exports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn posts that mention one or more companies")
+    parser.add_argument('--company', action='append', dest='companies', default=[],
+                        help="Company name to search for (repeatable)")
+    parser.add_argument('--companies-file', help="File with one company name per line")
+    parser.add_argument('--days', type=int, default=7, help="Number of days to filter posts")
+    parser.add_argument('--scrolls', type=int, default=50, help="Maximum number of scrolls per company")
+    parser.add_argument('--format', default='xlsx', choices=list(EXPORT_FORMATS), help="Export format")
+    parser.add_argument('--output-dir', default='.', help="Directory of the export files")
+    parser.add_argument('--session-file', default='linkedin_session.json',
+                        help="Saved login session, reused so only the first run needs a manual login")
+    parser.add_argument('--seen-index', help="SQLite file of exported posts; only new posts are exported")
+    parser.add_argument('--archive-dir', help="Archive the raw post HTML in this directory")
+    parser.add_argument('--relevance', help="Only keep posts whose text matches this regex, e.g. 'hiring|job opening'")
+    parser.add_argument('--headless', action='store_true', help="Run Chrome without a window (needs a saved session)")
+    parser.add_argument('--open', action='store_true', help="Open the export files when done (Windows)")
+    args = parser.parse_args()
+    missing = missing_dependency(args.format)
+    if missing:
+        parser.error(missing)
+
+    companies = list(args.companies)
+    if args.companies_file:
+        companies += load_companies(args.companies_file)
+    if not companies:
+        company = input("Enter the company name to search for: ").strip()
+        if not company:
+            parser.error("a company name is required")
+        companies = [company]
+
+    exports = run_batch(companies, args.days, args.scrolls, args.format, args.output_dir,
+                        streaming=True, session_file=args.session_file, seen_index=args.seen_index,
+                        archive_dir=args.archive_dir, headless=args.headless, lean=True,
+                        block_resources=True, relevance_pattern=args.relevance)
+
+    print(f"\n{'=' * 60}")
+    for company, path in exports.items():
+        print(f"{company}: {path or 'no posts'}")
+        if path and args.open:
+            try:
+                os.startfile(path)
+            except Exception as e:
+                print(f"Could not auto-open file: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+import argparse
+import json
+import re
+
+# Entity patterns, tried in this order at every position of the text. URLs and
+# emails come first so their "@" and digits are not picked up as mentions or
+# phone numbers.
+ENTITY_PATTERNS = [
+    ('url', r"\b(?:https?://|www\.)[^\s<>\"'()\[\]{}]+"),
+    ('email', r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
+    ('phone', r"(?<![\w+])\+?\d[\d \t().-]{7,}\d(?!\w)"),
+    ('hashtag', r"(?<![\w#])(?:hashtag)?#\w+"),
+    ('mention', r"(?<![\w.@])@[A-Za-z][\w.-]*\w")
+]
+
+# All entities are found in a single pass over the text
+ENTITY_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in ENTITY_PATTERNS))
+
+# Output columns of a post record, keyed by entity type
+CONTACT_COLUMNS = {
+    'email': 'Emails Found',
+    'phone': 'Phones Found',
+    'url': 'URLs Found',
+    'hashtag': 'Hashtags',
+    'mention': 'Mentions'
+}
+
+# Links back to LinkedIn itself are not contacts
+INTERNAL_HOSTS = ('linkedin.com', 'www.linkedin.com')
+
+_TRAILING_PUNCTUATION = '.,;:!?'
+
+
+def _normalize(kind, value):
+    """Return the canonical form of an entity, or None to drop it"""
+    if kind == 'email':
+        return value.rstrip('.').lower()
+
+    if kind == 'phone':
+        digits = re.sub(r'\D', '', value)
+        # Shorter digit runs are dates, amounts or IDs rather than phone numbers
+        if not 10 <= len(digits) <= 15:
+            return None
+        return ('+' if value.startswith('+') else '') + digits
+
+    if kind == 'url':
+        url = value.rstrip(_TRAILING_PUNCTUATION)
+        if url.lower().startswith('www.'):
+            url = 'https://' + url
+        scheme, _, rest = url.partition('://')
+        host, sep, path = rest.partition('/')
+        host = host.lower()
+        if host.endswith(INTERNAL_HOSTS):
+            return None
+        return f'{scheme.lower()}://{host}{sep}{path}'
+
+    if kind == 'hashtag':
+        return '#' + value.split('#', 1)[1].lower()
+
+    return value.rstrip(_TRAILING_PUNCTUATION)
+
+
+def extract_contacts(text):
+    """
+    Extract emails, phone numbers, external URLs, hashtags and @mentions
+
+    Args:
+        text (str): Full, untruncated post text
+
+    Returns:
+        dict: Normalized, de-duplicated values per entity type, in order of appearance
+    """
+    found = {kind: [] for kind, _ in ENTITY_PATTERNS}
+    seen = set()
+    for match in ENTITY_RE.finditer(text or ''):
+        kind = match.lastgroup
+        value = _normalize(kind, match.group())
+        if value and (kind, value.lower()) not in seen:
+            seen.add((kind, value.lower()))
+            found[kind].append(value)
+    return found
+
+
+def contact_columns(text):
+    """Return the contact columns of a post record for the given text"""
+    found = extract_contacts(text)
+    return {column: ', '.join(found[kind]) for kind, column in CONTACT_COLUMNS.items()}
+
+
+def enrich_records(records, texts=None, text_key='Post Text'):
+    """
+    Add (or recompute) the contact columns of a list of records
+
+    Args:
+        records (list): Post records, updated in place
+        texts (list): Full post texts aligned with records; defaults to each
+            record's text_key value
+        text_key (str): Record key holding the text when texts is not given
+
+    Returns:
+        list: The same records
+    """
+    texts = texts if texts is not None else (record.get(text_key, '') for record in records)
+    for record, text in zip(records, texts):
+        record.update(contact_columns(text))
+    return records
+
+
+def load_records(path):
+    """Load records from a JSON array or NDJSON file"""
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    if content.lstrip().startswith('['):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract contacts from scraped LinkedIn posts")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--records', help="JSON or NDJSON file of post records")
+    source.add_argument('--archive', help="Snapshot archive to reprocess from the full post HTML")
+    parser.add_argument('--days', type=int, default=7, help="Number of days to filter archived posts")
+    parser.add_argument('--output', help="Write the enriched records as JSON to this file")
+    args = parser.parse_args()
+
+    if args.archive:
+        from snapshot_archive import reprocess
+        # Records built from the archive already carry contacts from the full text
+        records = reprocess(args.archive, args.days)
+    else:
+        records = enrich_records(load_records(args.records))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+        print(f"Saved {len(records)} enriched posts to {args.output}")
+    else:
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+import functools
+import os
+import queue
+import shutil
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+try:
+    import chromedriver_autoinstaller
+except ImportError:
+    chromedriver_autoinstaller = None
+
+# Content settings that stop Chrome from loading or prompting for heavy resources
+# (2 = block). Post text, links and times do not need any of them.
+LEAN_CONTENT_SETTINGS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+    "profile.default_content_setting_values.media_stream_mic": 2,
+    "profile.default_content_setting_values.media_stream_camera": 2,
+    "profile.default_content_setting_values.automatic_downloads": 2
+}
+
+LEAN_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--autoplay-policy=user-gesture-required",
+    "--mute-audio",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only"
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_driver_path():
+    """Resolve the chromedriver binary once per process"""
+    found = shutil.which("chromedriver")
+    if chromedriver_autoinstaller:
+        # Matches the installed Chrome version and only downloads when the
+        # cached binary is missing or stale
+        return chromedriver_autoinstaller.install() or found
+    if found:
+        return found
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_driver_path(driver_path=None):
+    """
+    Return the chromedriver to use without repeating the lookup on every run
+
+    Args:
+        driver_path (str): Explicit chromedriver path; CHROMEDRIVER_PATH is used
+            when not given, then a cached automatic resolution
+
+    Returns:
+        str: Path of the chromedriver binary
+    """
+    driver_path = driver_path or os.environ.get("CHROMEDRIVER_PATH")
+    if driver_path:
+        return driver_path
+    return _cached_driver_path()
+
+
+def chrome_options(headless=False, lean=False, user_data_dir=None):
+    """
+    Build the Chrome options of a scraper browser
+
+    Args:
+        headless (bool): Run Chrome without a window (needs a saved session,
+            since the manual login cannot be done)
+        lean (bool): Block images and media, skip background services and return
+            from page loads once the DOM is ready instead of after every resource
+        user_data_dir (str): Chrome profile directory to reuse between runs
+
+    Returns:
+        Options: The Chrome options
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1366,900")
+    else:
+        options.add_argument("--start-maximized")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
+
+    if lean:
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option("prefs", LEAN_CONTENT_SETTINGS)
+        # The feed is rendered by scripts after DOMContentLoaded anyway and every
+        # phase waits for its own elements
+        options.page_load_strategy = "eager"
+    return options
+
+
+def create_driver(headless=False, lean=False, user_data_dir=None, driver_path=None, metrics=None):
+    """
+    Start a Chrome WebDriver
+
+    Args:
+        headless (bool): See chrome_options
+        lean (bool): See chrome_options
+        user_data_dir (str): See chrome_options
+        driver_path (str): See resolve_driver_path
+        metrics (Instrumentation): Times the driver resolution as "driver_install"
+
+    Returns:
+        WebDriver: The running driver
+    """
+    options = chrome_options(headless, lean, user_data_dir)
+    if metrics:
+        with metrics.phase("driver_install"):
+            path = resolve_driver_path(driver_path)
+    else:
+        path = resolve_driver_path(driver_path)
+    return webdriver.Chrome(service=Service(path), options=options)
+
+
+class DriverPool:
+    def __init__(self, size=1, **driver_options):
+        """
+        Keeps browsers started ahead of time and reuses released ones
+
+        A scraper that takes a driver from the pool skips the browser startup,
+        and a released driver keeps its logged-in session for the next scraper.
+        Spare drivers are started in a background thread, but only while fewer
+        than size drivers are idle, starting or in use.
+
+        Args:
+            size (int): Number of drivers the pool keeps running
+            **driver_options: Arguments of create_driver
+        """
+        self.size = size
+        self.driver_options = driver_options
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._warming = 0
+        self._in_use = 0
+        # Failed warm-ups queued as None, so a waiting acquire starts a driver itself
+        self._failed = 0
+
+    def _idle_count(self):
+        """Idle drivers, not counting failed warm-ups (called with the lock held)"""
+        return self._idle.qsize() - self._failed
+
+    def warm(self):
+        """Start drivers in the background until size drivers are idle, starting or in use"""
+        with self._lock:
+            missing = self.size - self._idle_count() - self._warming - self._in_use
+            self._warming += max(missing, 0)
+        for _ in range(missing):
+            threading.Thread(target=self._start_one, daemon=True).start()
+
+    def _start_one(self):
+        try:
+            driver = create_driver(**self.driver_options)
+        except Exception as e:
+            print(f"Could not pre-warm a browser: {e}")
+            driver = None
+        with self._lock:
+            self._warming -= 1
+            if driver is None:
+                self._failed += 1
+        self._idle.put(driver)
+
+    def acquire(self, timeout=120):
+        """
+        Take an idle driver, starting one if none is ready
+
+        Args:
+            timeout (float): Seconds to wait for a warming driver before starting
+                a new one (only waits while drivers are starting; a failed
+                warm-up ends the wait)
+
+        Returns:
+            WebDriver: A running driver
+        """
+        driver = None
+        while driver is None:
+            try:
+                if self._warming:
+                    driver = self._idle.get(timeout=timeout)
+                else:
+                    driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if driver is None:
+                with self._lock:
+                    self._failed -= 1
+        if driver is None:
+            driver = create_driver(**self.driver_options)
+        with self._lock:
+            self._in_use += 1
+        self.warm()
+        return driver
+
+    def release(self, driver):
+        """Return a driver for reuse, or quit it if it died or the pool is full"""
+        with self._lock:
+            self._in_use = max(self._in_use - 1, 0)
+            full = self._idle_count() + self._warming >= self.size
+        try:
+            driver.current_url
+        except Exception:
+            self._quit(driver)
+            self.warm()
+            return
+        if full:
+            self._quit(driver)
+            return
+        self._idle.put(driver)
+
+    def close(self):
+        """Quit all idle drivers"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if driver is None:
+                with self._lock:
+                    self._failed -= 1
+            else:
+                self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
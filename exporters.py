@@ -0,0 +1,128 @@
+import csv
+import io
+import json
+
+# format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+# Formats that can be generated row by row without holding the file in memory
+STREAMING_FORMATS = {'csv', 'ndjson'}
+
+# Formats that need an optional package: format -> (module, pip package)
+OPTIONAL_FORMATS = {'parquet': ('pyarrow', 'pyarrow')}
+
+
+def missing_dependency(fmt):
+    """
+    Check that the package an export format needs is installed
+
+    Args:
+        fmt (str): One of EXPORT_FORMATS
+
+    Returns:
+        str: A message naming the missing package, or None when the format can be written
+    """
+    if fmt not in OPTIONAL_FORMATS:
+        return None
+    module, package = OPTIONAL_FORMATS[fmt]
+    try:
+        __import__(module)
+    except ImportError:
+        return f"{fmt} export requires {package} (pip install {package})"
+    return None
+
+
+def record_columns(records):
+    """Return the union of record keys in first-seen order"""
+    columns = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key, None)
+    return list(columns)
+
+
+def iter_csv(records, columns=None):
+    """
+    Generate CSV text chunks, one per row
+
+    Args:
+        records (list): Post records
+        columns (list): Column order (defaults to the keys of the records)
+
+    Yields:
+        str: The header line, then one line per record
+    """
+    columns = columns or record_columns(records)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction='ignore')
+
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    for record in records:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(record)
+        yield buffer.getvalue()
+
+
+def iter_ndjson(records):
+    """Generate one JSON document per line and record"""
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def write_xlsx(records, fileobj, columns=None):
+    """Write an Excel file with openpyxl's constant-memory write-only mode"""
+    from openpyxl import Workbook
+
+    columns = columns or record_columns(records)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Posts')
+    sheet.append(columns)
+    for record in records:
+        sheet.append([record.get(column) for column in columns])
+    workbook.save(fileobj)
+
+
+def write_parquet(records, fileobj):
+    """Write a Parquet file (requires pyarrow)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.Table.from_pylist(list(records)), fileobj)
+
+
+def write_records(records, target, fmt='xlsx'):
+    """
+    Write records to a file path or binary file object in the given format
+
+    Args:
+        records (list): Post records
+        target (str or file): Destination path or binary file object
+        fmt (str): One of EXPORT_FORMATS
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    # Checked before the target is opened, so a missing package leaves no empty file behind
+    missing = missing_dependency(fmt)
+    if missing:
+        raise RuntimeError(missing)
+
+    if isinstance(target, str):
+        with open(target, 'wb') as f:
+            return write_records(records, f, fmt)
+
+    if fmt == 'xlsx':
+        write_xlsx(records, target)
+    elif fmt == 'parquet':
+        write_parquet(records, target)
+    else:
+        chunks = iter_csv(records) if fmt == 'csv' else iter_ndjson(records)
+        for chunk in chunks:
+            target.write(chunk.encode('utf-8'))
@@ -0,0 +1,196 @@
+import bisect
+import collections
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the per-post extraction latency histogram
+LATENCY_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """Process-wide totals of all scraper runs, rendered for Prometheus"""
+        self._lock = threading.Lock()
+        self.phase_seconds = collections.Counter()
+        self.webdriver_commands = collections.Counter()
+        self.sleep_seconds = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+
+    def add_phase_time(self, phase, seconds):
+        with self._lock:
+            self.phase_seconds[phase] += seconds
+
+    def add_command(self, phase, command):
+        with self._lock:
+            self.webdriver_commands[(phase, command)] += 1
+
+    def add_sleep(self, seconds):
+        with self._lock:
+            self.sleep_seconds += seconds
+
+    def observe_post(self, seconds):
+        with self._lock:
+            self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.latency_sum += seconds
+            self.latency_count += 1
+
+    def render_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format"""
+        with self._lock:
+            lines = [
+                "# HELP scraper_phase_seconds_total Time spent in each scraper phase.",
+                "# TYPE scraper_phase_seconds_total counter"
+            ]
+            for phase, seconds in sorted(self.phase_seconds.items()):
+                lines.append(f'scraper_phase_seconds_total{{phase="{phase}"}} {seconds:.6f}')
+
+            lines += [
+                "# HELP scraper_webdriver_commands_total WebDriver commands sent, by phase and command.",
+                "# TYPE scraper_webdriver_commands_total counter"
+            ]
+            for (phase, command), count in sorted(self.webdriver_commands.items()):
+                lines.append(f'scraper_webdriver_commands_total{{phase="{phase}",command="{command}"}} {count}')
+
+            lines += [
+                "# HELP scraper_sleep_seconds_total Time spent in explicit sleeps.",
+                "# TYPE scraper_sleep_seconds_total counter",
+                f"scraper_sleep_seconds_total {self.sleep_seconds:.6f}",
+                "# HELP scraper_post_extraction_seconds Extraction latency per post.",
+                "# TYPE scraper_post_extraction_seconds histogram"
+            ]
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ["+Inf"], self.latency_buckets):
+                cumulative += count
+                lines.append(f'scraper_post_extraction_seconds_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"scraper_post_extraction_seconds_sum {self.latency_sum:.6f}")
+            lines.append(f"scraper_post_extraction_seconds_count {self.latency_count}")
+        return "\n".join(lines) + "\n"
+
+
+# Shared by every Instrumentation unless another registry is given
+GLOBAL_METRICS = MetricsRegistry()
+
+
+class Instrumentation:
+    def __init__(self, registry=GLOBAL_METRICS):
+        """
+        Per-scraper phase timers, WebDriver command counts, sleep time and
+        per-post latency
+
+        Phases nest: time and commands are attributed to the innermost phase
+        only, so the phase totals add up to the instrumented wall time.
+
+        Args:
+            registry (MetricsRegistry): Also receives every measurement (or None)
+        """
+        self.registry = registry
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard the measurements of this instance"""
+        with self._lock:
+            self.phase_seconds = collections.Counter()
+            self.phase_commands = collections.defaultdict(collections.Counter)
+            self.sleep_seconds = 0.0
+            self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.latency_sum = 0.0
+            self.latency_count = 0
+            self._stack = []
+            self._entered = None
+
+    @property
+    def current_phase(self):
+        return self._stack[-1] if self._stack else "other"
+
+    def _charge(self):
+        """Add the time since the last phase switch to the current phase"""
+        now = time.perf_counter()
+        if self._stack and self._entered is not None:
+            elapsed = now - self._entered
+            self.phase_seconds[self._stack[-1]] += elapsed
+            if self.registry:
+                self.registry.add_phase_time(self._stack[-1], elapsed)
+        self._entered = now
+
+    @contextmanager
+    def phase(self, name):
+        """Attribute the time and WebDriver commands of the block to a phase"""
+        with self._lock:
+            self._charge()
+            self._stack.append(name)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._charge()
+                self._stack.pop()
+
+    def attach(self, driver):
+        """Count every WebDriver command sent through the driver"""
+        if getattr(driver, "_instrumented_by", None) is self:
+            return driver
+        # A reused (pooled) driver is re-wrapped from its original method, so its
+        # commands are not counted by earlier scrapers as well
+        original_execute = getattr(driver, "_original_execute", None) or driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.count_command(driver_command)
+            return original_execute(driver_command, params)
+
+        # WebElement calls are routed through their parent driver, so they are counted too
+        driver.execute = counting_execute
+        driver._original_execute = original_execute
+        driver._instrumented_by = self
+        return driver
+
+    def count_command(self, command):
+        # Commands may come from another thread than the one switching phases
+        with self._lock:
+            phase = self.current_phase
+            self.phase_commands[phase][command] += 1
+        if self.registry:
+            self.registry.add_command(phase, command)
+
+    def sleep(self, seconds):
+        """time.sleep that is accounted for"""
+        time.sleep(seconds)
+        with self._lock:
+            self.sleep_seconds += seconds
+        if self.registry:
+            self.registry.add_sleep(seconds)
+
+    def observe_post(self, seconds):
+        """Record the extraction latency of one post"""
+        with self._lock:
+            self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.latency_sum += seconds
+            self.latency_count += 1
+        if self.registry:
+            self.registry.observe_post(seconds)
+
+    def snapshot(self):
+        """Return the measurements as a JSON-serializable dict"""
+        with self._lock:
+            self._charge()
+            phases = {}
+            for phase in list(self.phase_seconds) + [p for p in self.phase_commands if p not in self.phase_seconds]:
+                commands = self.phase_commands.get(phase, {})
+                phases[phase] = {
+                    "seconds": round(self.phase_seconds.get(phase, 0.0), 3),
+                    "webdriver_calls": sum(commands.values()),
+                    "webdriver_commands": dict(commands)
+                }
+            return {
+                "phases": phases,
+                "webdriver_calls": sum(p["webdriver_calls"] for p in phases.values()),
+                "sleep_seconds": round(self.sleep_seconds, 3),
+                "post_latency": {
+                    "buckets": {str(bound): count for bound, count in zip(LATENCY_BUCKETS + ["+Inf"], self.latency_buckets)},
+                    "count": self.latency_count,
+                    "sum_seconds": round(self.latency_sum, 3)
+                }
+            }
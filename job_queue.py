@@ -0,0 +1,216 @@
+import queue
+import threading
+import uuid
+from datetime import datetime, timedelta
+from instrumentation import Instrumentation
+from scraper import LinkedInScraper
+from progress import ProgressLog
+
+
+class ScrapeJob:
+    def __init__(self, mention, time_filter, scroll_count, high_water_mark=None):
+        """
+        A single company scrape waiting in or processed by the job queue
+
+        Args:
+            mention (str): Company name to search for
+            time_filter (int): Number of days to filter posts
+            scroll_count (int): Number of times to scroll the page
+            high_water_mark (dict): urn and date of the newest post of an earlier
+                run; scrolling stops once it is reached
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.mention = mention
+        self.time_filter = time_filter
+        self.scroll_count = scroll_count
+        self.high_water_mark = high_water_mark
+        self.newest_post = None
+        self.status = 'queued'
+        self.message = 'Waiting for a free worker...'
+        self.progress = 0
+        self.results = []
+        self.metrics = None
+        self.events = ProgressLog()
+        self.worker = None
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self, include_results=False):
+        """Return a JSON-serializable view of the job"""
+        data = {
+            'id': self.id,
+            'company': self.mention,
+            'days_filter': self.time_filter,
+            'scroll_count': self.scroll_count,
+            'status': self.status,
+            'message': self.message,
+            'progress': self.progress,
+            'results_count': len(self.results),
+            'high_water_mark': self.high_water_mark,
+            'newest_post': self.newest_post,
+            'cursor': self.events.cursor,
+            'worker': self.worker,
+            'metrics': self.metrics,
+            'created_at': self.created_at.isoformat(timespec='seconds'),
+            'started_at': self.started_at.isoformat(timespec='seconds') if self.started_at else None,
+            'finished_at': self.finished_at.isoformat(timespec='seconds') if self.finished_at else None
+        }
+        if include_results:
+            data['results'] = list(self.results)
+        return data
+
+
+class JobQueue:
+    def __init__(self, workers=2, scraper_factory=None, engine_runner=None,
+                 finished_retention=timedelta(hours=6), max_finished_jobs=100):
+        """
+        Queue of scrape jobs served by a pool of long-lived browser workers
+
+        Every worker owns one LinkedInScraper whose browser and logged-in session
+        stay open across jobs, so each job only pays for search, scroll and extract.
+
+        Args:
+            workers (int): Number of concurrent browser workers
+            scraper_factory (callable): Returns a new, not yet started scraper
+            engine_runner (AsyncEngineRunner): When given, jobs run concurrently as
+                browser contexts of the async engine instead of on the workers
+            finished_retention (timedelta): How long finished jobs, with their results
+                and events, stay available
+            max_finished_jobs (int): Finished jobs kept at most; the oldest go first
+        """
+        self.workers = workers
+        self.scraper_factory = scraper_factory or (lambda: LinkedInScraper(None, 0, 0, streaming=True))
+        self.engine_runner = engine_runner
+        self.finished_retention = finished_retention
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs = {}
+        self._queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker threads if they are not running yet"""
+        with self._lock:
+            if self._threads:
+                return
+            for worker_id in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, args=(worker_id,), daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, mention, time_filter, scroll_count, high_water_mark=None):
+        """Queue a new job and return it"""
+        job = ScrapeJob(mention, time_filter, scroll_count, high_water_mark)
+        with self._lock:
+            self._evict_finished()
+            self.jobs[job.id] = job
+        if self.engine_runner:
+            self.engine_runner.submit(self._run_async(job))
+        else:
+            self.start()
+            self._queue.put(job)
+        return job
+
+    def _evict_finished(self):
+        """Forget finished jobs past the retention window or beyond the limit (called with the lock held)"""
+        finished = sorted((job for job in self.jobs.values() if job.finished_at),
+                          key=lambda job: job.finished_at)
+        cutoff = datetime.now() - self.finished_retention
+        excess = len(finished) - self.max_finished_jobs
+        for i, job in enumerate(finished):
+            if i < excess or job.finished_at < cutoff:
+                del self.jobs[job.id]
+
+    def get(self, job_id):
+        """Return the job with the given ID, or None"""
+        return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        """Return all jobs, newest first"""
+        return sorted(list(self.jobs.values()), key=lambda job: job.created_at, reverse=True)
+
+    @staticmethod
+    def _begin_job(job, worker):
+        """Mark a job as running and return its progress callback"""
+        job.worker = worker
+        job.started_at = datetime.now()
+        job.status = 'running'
+
+        def report_progress(event):
+            if event['type'] == 'progress':
+                job.progress = event['progress']
+                job.message = event['message']
+                if event['phase'] == 'done':
+                    job.newest_post = event.get('newest_post')
+            job.events.emit(event)
+        return report_progress
+
+    @staticmethod
+    def _job_done(job):
+        job.status = 'done'
+        job.message = f'Scraping complete! Found {len(job.results)} posts'
+        job.events.emit({'type': 'finished', 'message': job.message, 'posts': len(job.results)})
+
+    @staticmethod
+    def _job_failed(job, error):
+        job.status = 'failed'
+        job.message = f'Error: {str(error)}'
+        job.events.emit({'type': 'failed', 'message': job.message})
+
+    async def _run_async(self, job):
+        """Serve one job as a browser context of the async engine"""
+        report_progress = self._begin_job(job, 'async')
+        job.message = 'Scraping...'
+        metrics = Instrumentation()
+        try:
+            await self.engine_runner.engine.scrape(job.mention, job.time_filter, job.scroll_count,
+                                                   on_post=job.results.append, on_progress=report_progress,
+                                                   high_water_mark=job.high_water_mark, metrics=metrics)
+            self._job_done(job)
+        except Exception as e:
+            self._job_failed(job, e)
+        finally:
+            # Playwright calls are not WebDriver commands, so only phases and post latency are filled
+            job.metrics = metrics.snapshot()
+            job.finished_at = datetime.now()
+            job.events.close()
+
+    def _worker_loop(self, worker_id):
+        """Serve jobs from the queue with one persistent scraper"""
+        scraper = None
+        while True:
+            job = self._queue.get()
+            report_progress = self._begin_job(job, worker_id)
+
+            try:
+                if scraper is None:
+                    job.message = 'Starting browser and waiting for login...'
+                    scraper = self.scraper_factory()
+                    scraper.on_progress = report_progress
+                    scraper.start()
+
+                job.message = 'Scraping...'
+                scraper.on_post = job.results.append
+                scraper.on_progress = report_progress
+                scraper.scrape(job.mention, job.time_filter, job.scroll_count, job.high_water_mark)
+                self._job_done(job)
+
+            except Exception as e:
+                self._job_failed(job, e)
+                # The browser may be unusable; start a fresh one for the next job
+                if scraper:
+                    job.metrics = scraper.metrics.snapshot()
+                    try:
+                        scraper.close()
+                    except Exception:
+                        pass
+                    scraper = None
+            finally:
+                if scraper:
+                    # Per-job measurements; the first job also includes the browser startup
+                    job.metrics = scraper.metrics.snapshot()
+                    scraper.metrics.reset()
+                job.finished_at = datetime.now()
+                job.events.close()
+                self._queue.task_done()
@@ -0,0 +1,228 @@
+import random
+import threading
+import time
+
+# Default pause per kind of wait, in seconds, for a site that responds as expected
+DEFAULT_DELAYS = {
+    "scroll": 5,
+    "settle": 3
+}
+
+# Typical response time per kind of action, in seconds
+EXPECTED_RESPONSE_SECONDS = {
+    "search": 4.0,
+    "scroll": 1.5
+}
+
+# URL fragments of pages LinkedIn redirects to when it challenges or drops a session
+CHALLENGE_URL_MARKERS = ("/checkpoint", "/authwall", "/uas/login", "/login")
+
+# Looks for rate-limit banners in the elements LinkedIn uses for alerts and error
+# pages, instead of scanning the whole page source. Returns the page URL and the
+# matching banner text, if any.
+THROTTLE_STATE_SCRIPT = """
+const pattern = /try again later|too many requests|unusual activity|temporarily (restricted|unavailable)|rate limit/i;
+const candidates = document.querySelectorAll(
+    "[role='alert'], .artdeco-toast-item, .artdeco-inline-feedback, .artdeco-empty-state, " +
+    ".error-container, main h1, main h2");
+for (const el of candidates) {
+    const text = (el.textContent || "").trim();
+    if (pattern.test(text)) return {url: location.href, banner: text.slice(0, 200)};
+}
+return {url: location.href, banner: null};
+"""
+
+
+class PacingError(RuntimeError):
+    """The scraper has to stop to avoid tripping LinkedIn's limits"""
+
+
+class ThrottledError(PacingError):
+    """LinkedIn keeps throttling or has challenged the session"""
+
+
+class BudgetExceededError(PacingError):
+    """The action budget of the session is used up"""
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=5):
+        """
+        Thread-safe token bucket shared by every scraper of a process
+
+        Each page action (navigation, scroll) takes one token. Tokens refill at
+        rate per second up to burst. A backoff by any worker holds the bucket,
+        so all workers slow down together.
+
+        Args:
+            rate (float): Actions per second allowed across all workers
+            burst (int): Actions that may run back to back after an idle period
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._held_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens, going into debt if the bucket is empty
+
+        Returns:
+            float: Seconds the caller has to wait before acting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._held_until - now)
+
+    def hold(self, seconds):
+        """Stop handing out tokens for the given time"""
+        with self._lock:
+            self._held_until = max(self._held_until, time.monotonic() + seconds)
+
+
+class Pacer:
+    def __init__(self, bucket=None, action_budget=None, delays=None, min_factor=0.3, max_factor=3.0,
+                 backoff_base=30, backoff_max=900, max_retries=4, sleep=time.sleep):
+        """
+        Paces the page actions of one scraper session
+
+        Pauses scale with the observed page response time: a fast site is
+        scrolled faster than the defaults, a slow one slower. Throttling
+        signals trigger an exponential backoff with jitter.
+
+        Args:
+            bucket (TokenBucket): Rate limit shared with other workers (or None)
+            action_budget (int): Maximum page actions of the session (or None)
+            delays (dict): Base pause per kind, merged over DEFAULT_DELAYS
+            min_factor (float): Lower bound of the responsiveness factor
+            max_factor (float): Upper bound of the responsiveness factor
+            backoff_base (float): First backoff in seconds
+            backoff_max (float): Longest backoff in seconds
+            max_retries (int): Consecutive throttling signals before giving up
+            sleep (callable): Sleep function, e.g. an accounted one
+        """
+        self.bucket = bucket
+        self.action_budget = action_budget
+        self.delays = {**DEFAULT_DELAYS, **(delays or {})}
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retries = max_retries
+        self.sleep = sleep
+        self.actions = 0
+        self.response_ratio = None
+        self.throttle_count = 0
+        self.backoffs = []
+
+    def action(self, kind):
+        """Wait for a token and count the action against the budget"""
+        wait = self.reserve(kind)
+        if wait > 0:
+            self.sleep(wait)
+
+    def reserve(self, kind):
+        """
+        Count an action against the budget and take a token without waiting
+
+        Returns:
+            float: Seconds to wait before acting
+        """
+        if self.action_budget is not None and self.actions >= self.action_budget:
+            raise BudgetExceededError(f"Action budget of {self.action_budget} used up before {kind}")
+        self.actions += 1
+        return self.bucket.reserve() if self.bucket else 0.0
+
+    def observe(self, kind, seconds):
+        """Record how long the page took to respond to an action of a kind"""
+        ratio = seconds / EXPECTED_RESPONSE_SECONDS[kind]
+        if self.response_ratio is None:
+            self.response_ratio = ratio
+        else:
+            self.response_ratio = 0.7 * self.response_ratio + 0.3 * ratio
+
+    @property
+    def factor(self):
+        """Pause multiplier: observed response time relative to the expected one"""
+        if self.response_ratio is None:
+            return 1.0
+        return min(self.max_factor, max(self.min_factor, self.response_ratio))
+
+    def pause(self, kind):
+        """Sleep the base delay of a kind scaled to the page responsiveness, with jitter"""
+        delay = self.delays[kind] * self.factor * random.uniform(0.8, 1.2)
+        self.sleep(delay)
+        return delay
+
+    def detect_throttle(self, driver):
+        """
+        Check the current page for throttling signals
+
+        Returns:
+            str: A description of the signal, or None
+        """
+        try:
+            state = driver.execute_script(THROTTLE_STATE_SCRIPT) or {}
+        except Exception:
+            return None
+        return self.throttle_reason(state)
+
+    def throttle_reason(self, state):
+        """Describe the throttling signal in a THROTTLE_STATE_SCRIPT result, or None"""
+        url = (state.get("url") or "").lower()
+        if any(marker in url for marker in CHALLENGE_URL_MARKERS):
+            return f"redirected to {url}"
+        if state.get("banner"):
+            return f"banner: {state['banner']}"
+        return None
+
+    def backoff(self, reason):
+        """
+        Back off after a throttling signal
+
+        Challenges (checkpoint, authwall, login redirects) need a person and are
+        raised immediately; other signals wait exponentially longer each time.
+
+        Raises:
+            ThrottledError: On a challenge, or after max_retries signals in a row
+        """
+        self.sleep(self.backoff_delay(reason))
+
+    def backoff_delay(self, reason):
+        """
+        Count a throttling signal and return the backoff without sleeping
+
+        Raises:
+            ThrottledError: See backoff
+        """
+        self.throttle_count += 1
+        if reason.startswith("redirected to"):
+            raise ThrottledError(f"LinkedIn challenged the session ({reason})")
+        if self.throttle_count > self.max_retries:
+            raise ThrottledError(f"Still throttled after {self.max_retries} backoffs ({reason})")
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (self.throttle_count - 1))
+        delay *= random.uniform(0.5, 1.5)
+        self.backoffs.append({"reason": reason, "seconds": round(delay, 1)})
+        print(f"Throttled ({reason}); backing off for {delay:.0f} seconds")
+        if self.bucket:
+            self.bucket.hold(delay)
+        return delay
+
+    def recover(self):
+        """Reset the backoff after a successful action"""
+        self.throttle_count = 0
+
+    def stats(self):
+        return {
+            "actions": self.actions,
+            "action_budget": self.action_budget,
+            "delay_factor": round(self.factor, 2),
+            "backoffs": list(self.backoffs)
+        }
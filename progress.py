@@ -0,0 +1,95 @@
+import collections
+import json
+import threading
+import time
+
+
+class ProgressLog:
+    def __init__(self, max_events=5000):
+        """
+        Append-only log of progress events read with a cursor
+
+        Every event gets an increasing ID. Readers pass the last ID they have
+        seen and get only newer events, either immediately or after waiting for
+        the next one, which serves both Server-Sent Events and long-polling.
+
+        Args:
+            max_events (int): Oldest events are dropped beyond this many
+        """
+        self._events = collections.deque(maxlen=max_events)
+        self._next_id = 1
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def cursor(self):
+        """ID of the newest event (0 if there is none)"""
+        return self._next_id - 1
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def emit(self, event):
+        """
+        Append an event and wake up waiting readers
+
+        Args:
+            event (dict): Event data; must contain a 'type' key
+
+        Returns:
+            dict: The stored event including its id and time
+        """
+        with self._condition:
+            event = dict(event, id=self._next_id, time=round(time.time(), 3))
+            self._next_id += 1
+            self._events.append(event)
+            self._condition.notify_all()
+        return event
+
+    def close(self):
+        """Mark the log as complete; readers stop after the remaining events"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def since(self, cursor, timeout=None):
+        """
+        Return the events newer than the cursor
+
+        Args:
+            cursor (int): ID of the last event the reader has seen
+            timeout (float): Seconds to wait when there are no newer events yet
+
+        Returns:
+            list: The newer events, possibly empty
+        """
+        with self._condition:
+            if timeout and self._next_id - 1 <= cursor and not self._closed:
+                self._condition.wait(timeout)
+            return [event for event in self._events if event['id'] > cursor]
+
+
+def sse_stream(log, cursor=0, keepalive=15):
+    """
+    Generate a Server-Sent Events stream from a progress log
+
+    Args:
+        log (ProgressLog): Log to follow
+        cursor (int): ID of the last event the client has seen
+        keepalive (float): Seconds between keep-alive comments while idle
+
+    Yields:
+        str: SSE frames
+    """
+    while True:
+        events = log.since(cursor, timeout=keepalive)
+        if not events:
+            if log.closed:
+                return
+            yield ": keep-alive\n\n"
+            continue
+
+        for event in events:
+            cursor = event['id']
+            yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
@@ -0,0 +1,88 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+# Unit spellings LinkedIn uses in relative post times ("3h", "2 days ago", "1mo",
+# "1yr", ...) mapped to their length in seconds. Months and years are
+# approximated as 30 and 365 days.
+UNIT_SECONDS = {
+    's': 1, 'sec': 1, 'secs': 1, 'second': 1, 'seconds': 1,
+    'm': 60, 'min': 60, 'mins': 60, 'minute': 60, 'minutes': 60,
+    'h': 3600, 'hr': 3600, 'hrs': 3600, 'hour': 3600, 'hours': 3600,
+    'd': 86400, 'day': 86400, 'days': 86400,
+    'w': 604800, 'wk': 604800, 'wks': 604800, 'week': 604800, 'weeks': 604800,
+    'mo': 2592000, 'mos': 2592000, 'month': 2592000, 'months': 2592000,
+    'y': 31536000, 'yr': 31536000, 'yrs': 31536000, 'year': 31536000, 'years': 31536000
+}
+
+# A number directly followed by a unit, e.g. "3d", "3 d", "3 days ago", "• 1mo •".
+# Longer spellings come first so "mo" is not read as minutes.
+_UNITS = '|'.join(sorted(UNIT_SECONDS, key=len, reverse=True))
+RELATIVE_TIME_PATTERN = rf'(?<![\w.])(\d+)\s*({_UNITS})(?![a-z])'
+_RELATIVE_TIME = re.compile(RELATIVE_TIME_PATTERN)
+_JUST_NOW = re.compile(r'(?<![a-z])(?:just now|now|moments? ago)(?![a-z])')
+_YESTERDAY = re.compile(r'(?<![a-z])yesterday(?![a-z])')
+
+
+@lru_cache(maxsize=512)
+def relative_offset(time_text):
+    """
+    Parse a relative LinkedIn time text into how long ago the post was made
+
+    A feed only contains a handful of distinct time texts, so results are cached.
+
+    Args:
+        time_text (str): e.g. "3h", "2 days ago", "1mo", "1yr • Edited"
+
+    Returns:
+        timedelta: The age of the post, or None if the text is not a relative time
+    """
+    text = time_text.lower().strip()
+    match = _RELATIVE_TIME.search(text)
+    if match:
+        return timedelta(seconds=int(match.group(1)) * UNIT_SECONDS[match.group(2)])
+    if _JUST_NOW.search(text):
+        return timedelta(0)
+    if _YESTERDAY.search(text):
+        return timedelta(days=1)
+    return None
+
+
+def parse_relative_time(time_text, reference=None):
+    """
+    Convert a relative time text into a datetime
+
+    Args:
+        time_text (str): Relative time text of a post
+        reference (datetime): Moment the text was captured (defaults to now)
+
+    Returns:
+        datetime: The post time, or None if the text could not be parsed
+    """
+    offset = relative_offset(time_text)
+    if offset is None:
+        return None
+    return (reference or datetime.now()) - offset
+
+
+def parse_relative_times(time_texts, reference=None):
+    """
+    Convert a column of relative time texts into datetimes in one vectorized pass
+
+    Args:
+        time_texts (iterable or pandas.Series): Relative time texts
+        reference (datetime): Moment the texts were captured (defaults to now)
+
+    Returns:
+        pandas.Series: Timestamps, NaT where a text could not be parsed
+    """
+    import pandas as pd
+
+    texts = pd.Series(time_texts, dtype='object').fillna('').astype(str).str.lower().str.strip()
+    parts = texts.str.extract(RELATIVE_TIME_PATTERN)
+    seconds = pd.to_numeric(parts[0], errors='coerce') * parts[1].map(UNIT_SECONDS)
+
+    seconds = seconds.mask(seconds.isna() & texts.str.contains(_JUST_NOW.pattern, regex=True), 0)
+    seconds = seconds.mask(seconds.isna() & texts.str.contains(_YESTERDAY.pattern, regex=True), 86400)
+
+    return pd.Timestamp(reference or datetime.now()) - pd.to_timedelta(seconds, unit='s')
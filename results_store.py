@@ -0,0 +1,218 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from contacts import CONTACT_COLUMNS
+
+# Record column -> database column
+RECORD_COLUMNS = {
+    'Post Date': 'post_date',
+    'Post Link': 'post_link',
+    'Time Text': 'time_text',
+    'Emails Found': 'emails',
+    'Phones Found': 'phones',
+    'URLs Found': 'urls',
+    'Hashtags': 'hashtags',
+    'Mentions': 'mentions'
+}
+
+# Rows buffered before they are written in one transaction
+FLUSH_SIZE = 50
+
+
+def _fts_query(text):
+    """Quote every term, so user input is matched literally instead of as FTS5 syntax"""
+    terms = ['"' + term.replace('"', '""') + '"' for term in text.split()]
+    return ' '.join(terms)
+
+
+class ResultsStore:
+    def __init__(self, path):
+        """
+        Persistent store of scraped posts with full-text search
+
+        Posts are keyed by company and activity URN (or link), so a post found
+        again by a later run is updated instead of duplicated. The full post
+        text, not the truncated export column, is indexed with FTS5 when the
+        SQLite build supports it.
+
+        Args:
+            path (str): SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                company TEXT NOT NULL,
+                post_key TEXT NOT NULL,
+                post_urn TEXT,
+                post_date TEXT NOT NULL,
+                post_link TEXT NOT NULL,
+                time_text TEXT,
+                post_text TEXT,
+                emails TEXT,
+                phones TEXT,
+                urls TEXT,
+                hashtags TEXT,
+                mentions TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                UNIQUE (company, post_key)
+            );
+            CREATE INDEX IF NOT EXISTS posts_company_date ON posts (company, post_date);
+            CREATE INDEX IF NOT EXISTS posts_date ON posts (post_date);
+            CREATE INDEX IF NOT EXISTS posts_urn ON posts (post_urn);
+        """)
+        self.fts = self._create_fts()
+        self._conn.commit()
+
+    def _create_fts(self):
+        """Create the FTS5 index and its sync triggers; return False if FTS5 is unavailable"""
+        try:
+            self._conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+                    post_text, content='posts', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+                    INSERT INTO posts_fts (rowid, post_text) VALUES (new.id, new.post_text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+                    INSERT INTO posts_fts (posts_fts, rowid, post_text) VALUES ('delete', old.id, old.post_text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF post_text ON posts BEGIN
+                    INSERT INTO posts_fts (posts_fts, rowid, post_text) VALUES ('delete', old.id, old.post_text);
+                    INSERT INTO posts_fts (rowid, post_text) VALUES (new.id, new.post_text);
+                END;
+            """)
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 is not available, text search falls back to LIKE: {e}")
+            return False
+
+    def add(self, company, record, post_text=None, post_urn=None):
+        """
+        Buffer a post record; buffered posts are written in bulk
+
+        Args:
+            company (str): Company that was searched
+            record (dict): Output record of LinkedInScraper
+            post_text (str): Full post text (defaults to the record's Post Text)
+            post_urn (str): Activity URN of the post
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        row = {column: record.get(key, '') for key, column in RECORD_COLUMNS.items()}
+        row.update({
+            'company': company.lower(),
+            'post_key': post_urn or record['Post Link'],
+            'post_urn': post_urn,
+            'post_text': post_text if post_text is not None else record.get('Post Text', ''),
+            'now': now
+        })
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= FLUSH_SIZE:
+                self._flush_locked()
+
+    def flush(self):
+        """Write all buffered posts in one transaction"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany("""
+                INSERT INTO posts (company, post_key, post_urn, post_date, post_link, time_text, post_text,
+                                   emails, phones, urls, hashtags, mentions, first_seen, last_seen)
+                VALUES (:company, :post_key, :post_urn, :post_date, :post_link, :time_text, :post_text,
+                        :emails, :phones, :urls, :hashtags, :mentions, :now, :now)
+                ON CONFLICT (company, post_key) DO UPDATE SET
+                    post_text = excluded.post_text,
+                    emails = excluded.emails,
+                    phones = excluded.phones,
+                    urls = excluded.urls,
+                    hashtags = excluded.hashtags,
+                    mentions = excluded.mentions,
+                    last_seen = excluded.last_seen
+            """, self._pending)
+        self._pending = []
+
+    def query(self, company=None, text=None, days=None, page=1, per_page=50):
+        """
+        Search stored posts, newest first (best text match first when searching)
+
+        Args:
+            company (str): Only posts found for this company
+            text (str): Words that must all appear in the full post text
+            days (int): Only posts from the last number of days
+            page (int): 1-based page number
+            per_page (int): Posts per page
+
+        Returns:
+            dict: total, page, per_page and posts (records with a Company column)
+        """
+        conditions, params = [], []
+        joins = ""
+        order = "p.post_date DESC, p.id DESC"
+        if company:
+            conditions.append("p.company = ?")
+            params.append(company.lower())
+        if days is not None:
+            conditions.append("p.post_date >= ?")
+            params.append((datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'))
+        if text and text.strip():
+            if self.fts:
+                joins = "JOIN posts_fts ON posts_fts.rowid = p.id"
+                conditions.append("posts_fts MATCH ?")
+                params.append(_fts_query(text))
+                order = "bm25(posts_fts), p.post_date DESC"
+            else:
+                for term in text.split():
+                    conditions.append("p.post_text LIKE ?")
+                    params.append(f"%{term}%")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        page = max(page, 1)
+        with self._lock:
+            self._flush_locked()
+            total = self._conn.execute(f"SELECT COUNT(*) FROM posts p {joins} {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT p.* FROM posts p {joins} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                params + [per_page, (page - 1) * per_page]).fetchall()
+
+        return {
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'posts': [self._to_record(row) for row in rows]
+        }
+
+    @staticmethod
+    def _to_record(row):
+        text = row['post_text'] or ''
+        record = {
+            'Company': row['company'],
+            'Post Date': row['post_date'],
+            'Post Link': row['post_link'],
+            'Time Text': row['time_text'],
+            'Post Text': text[:500] + "..." if len(text) > 500 else text
+        }
+        for column in CONTACT_COLUMNS.values():
+            record[column] = row[RECORD_COLUMNS[column]]
+        record['First Seen'] = row['first_seen']
+        return record
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
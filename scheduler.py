@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from scraper import activity_id
+
+
+class Scheduler:
+    def __init__(self, path, job_queue, check_interval=30):
+        """
+        Runs watched companies through the job queue at a fixed interval
+
+        Every watch keeps a high-water mark: the URN and date of the newest post
+        found by its last run. The next run passes the mark to the scraper, which
+        stops scrolling as soon as it reaches posts collected before, so frequent
+        runs only need a scroll or two.
+
+        Args:
+            path (str): SQLite database file of the watches and their marks
+            job_queue (JobQueue): Queue the scheduled jobs are submitted to
+            check_interval (int): Seconds between checks for due watches
+        """
+        self.path = path
+        self.job_queue = job_queue
+        self.check_interval = check_interval
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._running = {}
+        self._thread = None
+        self._stop = threading.Event()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS watches (
+                company TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                interval_minutes INTEGER NOT NULL,
+                days_filter INTEGER NOT NULL,
+                scroll_count INTEGER NOT NULL,
+                mark_urn TEXT,
+                mark_date TEXT,
+                last_run TEXT,
+                next_run TEXT NOT NULL,
+                last_job_id TEXT
+            )
+        """)
+        self._conn.commit()
+
+    def watch(self, company, interval_minutes, days_filter=7, scroll_count=50):
+        """
+        Add a company to the schedule, or change its settings; its first run is due now
+
+        Args:
+            company (str): Company name to search for
+            interval_minutes (int): Minutes between the starts of two runs
+            days_filter (int): Number of days to filter posts
+            scroll_count (int): Maximum number of scrolls per run
+
+        Returns:
+            dict: The watch
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO watches (company, name, interval_minutes, days_filter, scroll_count, next_run)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (company) DO UPDATE SET
+                    name = excluded.name,
+                    interval_minutes = excluded.interval_minutes,
+                    days_filter = excluded.days_filter,
+                    scroll_count = excluded.scroll_count,
+                    next_run = excluded.next_run
+            """, (company.lower(), company, interval_minutes, days_filter, scroll_count, now))
+            self._conn.commit()
+        return self.get(company)
+
+    def unwatch(self, company):
+        """Remove a company from the schedule; return False if it was not watched"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM watches WHERE company = ?", (company.lower(),))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def get(self, company):
+        """Return the watch of a company, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM watches WHERE company = ?", (company.lower(),)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def watches(self):
+        """Return all watches, next due first"""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM watches ORDER BY next_run").fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def high_water_mark(self, company):
+        """Return the urn and date of the newest post collected for a company, or None"""
+        watch = self.get(company)
+        return watch['high_water_mark'] if watch else None
+
+    def advance_mark(self, company, post):
+        """
+        Move the high-water mark of a company to a post, unless the mark is newer already
+
+        Args:
+            company (str): Watched company
+            post (dict): urn and date (YYYY-MM-DD) of the newest post of a run
+        """
+        if not post or not post.get('urn'):
+            return
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mark_urn, mark_date FROM watches WHERE company = ?", (company.lower(),)).fetchone()
+            if row is None:
+                return
+            if row['mark_urn'] and (row['mark_date'], activity_id(row['mark_urn']) or 0) >= \
+                    (post['date'], activity_id(post['urn']) or 0):
+                return
+            self._conn.execute("UPDATE watches SET mark_urn = ?, mark_date = ? WHERE company = ?",
+                               (post['urn'], post['date'], company.lower()))
+            self._conn.commit()
+
+    def run_due(self, now=None):
+        """
+        Record the marks of finished runs and submit a job for every due watch
+
+        A watch whose previous job is still queued or running is not submitted again.
+
+        Returns:
+            list: The submitted jobs
+        """
+        now = now or datetime.now()
+        self._collect_finished()
+
+        submitted = []
+        for watch in self.watches():
+            if watch['next_run'] > now.isoformat(timespec='seconds'):
+                break
+            if watch['company'] in self._running:
+                continue
+
+            job = self.job_queue.submit(watch['name'], watch['days_filter'], watch['scroll_count'],
+                                        watch['high_water_mark'])
+            self._running[watch['company']] = job
+            next_run = now + timedelta(minutes=watch['interval_minutes'])
+            with self._lock:
+                self._conn.execute("UPDATE watches SET last_run = ?, next_run = ?, last_job_id = ? WHERE company = ?",
+                                   (now.isoformat(timespec='seconds'), next_run.isoformat(timespec='seconds'),
+                                    job.id, watch['company']))
+                self._conn.commit()
+            print(f"Scheduled run of {watch['name']} queued as job {job.id}")
+            submitted.append(job)
+        return submitted
+
+    def _collect_finished(self):
+        """Advance the marks of watches whose jobs are done and forget finished jobs"""
+        for company, job in list(self._running.items()):
+            if job.status == 'done':
+                self.advance_mark(company, job.newest_post)
+            if job.status in ('done', 'failed'):
+                del self._running[company]
+
+    def start(self):
+        """Start checking for due watches in a background thread, unless it is running already"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while True:
+            try:
+                self.run_due()
+            except Exception as e:
+                print(f"Scheduler check failed: {e}")
+            if self._stop.wait(self.check_interval):
+                return
+
+    def _to_dict(self, row):
+        mark = {'urn': row['mark_urn'], 'date': row['mark_date']} if row['mark_urn'] else None
+        job = self._running.get(row['company'])
+        return {
+            'company': row['company'],
+            'name': row['name'],
+            'interval_minutes': row['interval_minutes'],
+            'days_filter': row['days_filter'],
+            'scroll_count': row['scroll_count'],
+            'high_water_mark': mark,
+            'last_run': row['last_run'],
+            'next_run': row['next_run'],
+            'last_job_id': row['last_job_id'],
+            'running': job is not None and job.status in ('queued', 'running')
+        }
+
+    def close(self):
+        self.stop()
+        with self._lock:
+            self._conn.close()
@@ -1,16 +1,332 @@
 import time
+import os
 import re
+import functools
+import json
+import tempfile
+from urllib.parse import quote
 from datetime import datetime, timedelta
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from driver_factory import create_driver
+from network_filter import DEFAULT_BLOCKED_CATEGORIES, blocked_url_patterns, install_request_filter
+from seen_index import SeenIndex
+from results_store import ResultsStore
+from relative_time import parse_relative_time
+from contacts import contact_columns
+from instrumentation import Instrumentation
+from pacing import Pacer
+from selector_stats import SelectorStats
+
+POST_SELECTORS = [
+    '[data-urn*="urn:li:activity"]',
+    '.feed-shared-update-v2',
+    '.update-components-actor',
+    'article'
+]
+
+TEXT_SELECTORS = [
+    ".feed-shared-text__text-view",
+    ".feed-shared-update-v2__description",
+    ".update-components-text",
+    ".feed-shared-text",
+    "[data-test-id='main-feed-activity-card'] .break-words"
+]
+
+TIME_KEYWORDS = ["ago", "h", "d", "w", "week", "day"]
+
+SEE_MORE_SELECTORS = [
+    "button[aria-label*='see more']",
+    "button[aria-label*='See more']",
+    "button.feed-shared-inline-show-more-text__see-more-less-toggle",
+    "button[data-tracking-control-name='public_post_feed-text-see-more']",
+    ".feed-shared-text__see-more",
+    "span.feed-shared-text__see-more-link",
+    "[aria-expanded='false']"
+]
+
+# Quiet period after the feed grows before a scroll counts as loaded
+SCROLL_SETTLE_MS = 400
+
+# Search URLs probed for a mention, most preferred first; {mention} is URL-encoded.
+# All of them open the Posts (content) vertical directly.
+SEARCH_URL_TEMPLATES = [
+    "https://www.linkedin.com/search/results/content/?keywords=%22%40{mention}%22&origin=SWITCH_SEARCH_VERTICAL",
+    "https://www.linkedin.com/search/results/content/?keywords=%40{mention}&searchId=&origin=SWITCH_SEARCH_VERTICAL",
+    "https://www.linkedin.com/search/results/content/?keywords={mention}&origin=GLOBAL_SEARCH_HEADER"
+]
+
+# Appended to the search URLs whenever scrolling stops early on old posts (the time
+# window or a high-water mark), since that is only safe when newer posts come first
+DATE_SORT_PARAMETER = "sortBy=%22date_posted%22"
+
+# Elements that show a search page has loaded results, or has none
+SEARCH_RESULT_SELECTORS = [
+    '[data-urn*="urn:li:activity"]',
+    '.feed-shared-update-v2',
+    '.reusable-search__result-container'
+]
+
+SEARCH_EMPTY_SELECTORS = [
+    '.search-reusable-search-no-results',
+    '.search-no-results__container',
+    '.artdeco-empty-state'
+]
+
+# Shared helpers prepended to the injected scripts below. Lookups through
+# countSelector are collected in selectorStats ({group: {selector: {tries, hits,
+# ms}}}), which scripts return for SelectorStats.
+_JS_HELPERS = """
+const visibleText = (el) => (el.innerText || "").trim();
+
+const selectorStats = {};
+const countSelector = (group, selector, started, hit) => {
+    const groupStats = selectorStats[group] = selectorStats[group] || {};
+    const stats = groupStats[selector] = groupStats[selector] || {tries: 0, hits: 0, ms: 0};
+    stats.tries++;
+    if (hit) stats.hits++;
+    stats.ms += performance.now() - started;
+};
+
+const findPosts = (postSelectors) => {
+    for (const selector of postSelectors) {
+        const started = performance.now();
+        const posts = Array.from(document.querySelectorAll(selector));
+        countSelector("post", selector, started, posts.length > 0);
+        if (posts.length) return {selector: selector, posts: posts};
+    }
+    return {selector: null, posts: []};
+};
+
+const timeTextOf = (post, timeKeywords) => {
+    const ago = document.evaluate(".//span[contains(text(),'ago')]", post, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (ago) return visibleText(ago);
+    for (const el of post.querySelectorAll("time, .visually-hidden")) {
+        const t = visibleText(el);
+        if (t && timeKeywords.some((k) => t.toLowerCase().includes(k))) return t;
+    }
+    return "";
+};
+"""
+
+# Reports whether a search page shows results ("results"), an empty state
+# ("empty") or is still loading ("loading"), without reading the page source.
+SEARCH_STATE_SCRIPT = _JS_HELPERS + """
+const resultSelectors = arguments[0];
+const emptySelectors = arguments[1];
+if (findPosts(resultSelectors).posts.length) return "results";
+if (emptySelectors.some((selector) => document.querySelector(selector))) return "empty";
+const headings = document.querySelectorAll("main h1, main h2");
+if (Array.from(headings).some((h) => /\\b(no|0) results\\b/i.test(h.textContent))) return "empty";
+return "loading";
+"""
+
+# Clicks every visible, not yet expanded "See more" toggle under the given root in
+# one call. Clicked toggles are marked so later calls never collapse them again.
+# Toggles inside posts whose data-urn is in skipUrns (known posts seen on the page
+# by an earlier extraction) are left alone. With onlyIds,
+# only the posts tagged with those data-scraper-id values are searched. Returns the
+# number of clicked toggles and the selector statistics, with at most one try per
+# selector per call (many posts simply have no toggle).
+EXPAND_SEE_MORE_SCRIPT = _JS_HELPERS + """
+const selectors = arguments[0];
+const skipUrns = new Set(arguments[2] || []);
+const onlyIds = arguments[3];
+const roots = onlyIds
+    ? onlyIds.map((id) => document.querySelector(`[data-scraper-id="${id}"]`)).filter(Boolean)
+    : [arguments[1] || document];
+const EXPANDED = "data-scraper-expanded";
+const isVisible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+
+let count = 0;
+for (const selector of selectors) {
+    const started = performance.now();
+    let found = false;
+    for (const root of roots) {
+        let toggles;
+        try {
+            toggles = root.querySelectorAll(selector);
+        } catch (e) {
+            break;
+        }
+        if (toggles.length) found = true;
+        for (const el of toggles) {
+            if (el.hasAttribute(EXPANDED) || el.getAttribute("aria-expanded") === "true") continue;
+            if (el.disabled || !isVisible(el)) continue;
+            if (skipUrns.size) {
+                const post = el.closest("[data-urn]");
+                if (post && skipUrns.has(post.getAttribute("data-urn"))) continue;
+            }
+            el.setAttribute(EXPANDED, "");
+            el.click();
+            count++;
+        }
+    }
+    countSelector("see_more", selector, started, found);
+}
+return {count: count, selectorStats: selectorStats};
+"""
+
+# Reads text, time text, URN and activity link of every post in one round trip.
+# Mirrors the selector fallbacks of the element-by-element extraction loop.
+# With onlyNew, posts returned by an earlier call are marked and skipped; with
+# prune, those already processed nodes are emptied (keeping their height so the
+# feed's scroll position and infinite loading are unaffected). With includeHtml,
+# each post's outerHTML is returned for the snapshot archive. With tagIds, every post gets a stable data-scraper-id that is returned as its id; ids
+# reads only the posts with those ids (the deep pass of two-tier extraction).
+EXTRACT_POSTS_SCRIPT = _JS_HELPERS + """
+const postSelectors = arguments[0];
+const textSelectors = arguments[1];
+const timeKeywords = arguments[2];
+const options = arguments[3] || {};
+const SEEN = "data-scraper-seen";
+const ID = "data-scraper-id";
+
+let usedSelector = null;
+let posts;
+if (options.ids) {
+    posts = options.ids.map((id) => document.querySelector(`[${ID}="${id}"]`)).filter(Boolean);
+} else {
+    ({selector: usedSelector, posts} = findPosts(postSelectors));
+}
+
+if (options.onlyNew) {
+    if (options.prune) {
+        for (const post of posts) {
+            if (post.hasAttribute(SEEN) && !post.hasAttribute("data-scraper-pruned")) {
+                post.style.minHeight = post.offsetHeight + "px";
+                post.replaceChildren();
+                post.setAttribute("data-scraper-pruned", "");
+            }
+        }
+    }
+    posts = posts.filter((post) => !post.hasAttribute(SEEN));
+    posts.forEach((post) => post.setAttribute(SEEN, ""));
+}
+
+const items = posts.map((post) => {
+    let text = "";
+    for (const selector of textSelectors) {
+        const started = performance.now();
+        const el = post.querySelector(selector);
+        countSelector("text", selector, started, !!el);
+        if (el) {
+            text = visibleText(el);
+            if (text) break;
+        }
+    }
+
+    let link = "";
+    for (const a of post.querySelectorAll("a")) {
+        if (a.href && a.href.includes("activity")) {
+            link = a.href;
+            break;
+        }
+    }
+
+    const item = {urn: post.getAttribute("data-urn"), text: text, timeText: timeTextOf(post, timeKeywords), link: link};
+    if (options.tagIds) {
+        if (!post.hasAttribute(ID)) {
+            window.__scraperNextId = (window.__scraperNextId || 0) + 1;
+            post.setAttribute(ID, String(window.__scraperNextId));
+        }
+        item.id = post.getAttribute(ID);
+    }
+    if (options.includeHtml) item.html = post.outerHTML;
+    return item;
+});
+
+return {selector: usedSelector, posts: items, selectorStats: selectorStats};
+"""
+
+# Scrolls to the bottom and resolves once the feed has grown and the DOM has been
+# quiet for settleMs, or after timeoutMs without growth. Growth is detected with a
+# MutationObserver instead of a fixed sleep. Returns the time texts and URNs of the
+# posts that appeared with this scroll so the caller can stop once they are too old
+# or already collected.
+SCROLL_AND_WAIT_SCRIPT = _JS_HELPERS + """
+const postSelectors = arguments[0];
+const timeKeywords = arguments[1];
+const timeoutMs = arguments[2];
+const settleMs = arguments[3];
+const done = arguments[arguments.length - 1];
+
+const prevHeight = document.body.scrollHeight;
+const prevCount = findPosts(postSelectors).posts.length;
+let grew = false;
+let finished = false;
+let settleTimer = null;
+let checkScheduled = false;
+
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timeoutTimer);
+    clearTimeout(settleTimer);
+    const posts = findPosts(postSelectors).posts;
+    done({
+        grew: grew,
+        height: document.body.scrollHeight,
+        count: posts.length,
+        newTimeTexts: posts.slice(prevCount).map((post) => timeTextOf(post, timeKeywords)),
+        newUrns: posts.slice(prevCount).map((post) => post.getAttribute("data-urn")).filter(Boolean)
+    });
+};
+
+const check = () => {
+    checkScheduled = false;
+    if (!grew && (document.body.scrollHeight > prevHeight
+            || findPosts(postSelectors).posts.length > prevCount)) {
+        grew = true;
+    }
+    if (grew) {
+        clearTimeout(settleTimer);
+        settleTimer = setTimeout(finish, settleMs);
+    }
+};
+
+const observer = new MutationObserver(() => {
+    if (!checkScheduled) {
+        checkScheduled = true;
+        setTimeout(check, 50);
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+const timeoutTimer = setTimeout(finish, timeoutMs);
+
+window.scrollTo(0, document.body.scrollHeight);
+check();
+"""
+
+def instrumented(phase):
+    """Attribute the time and WebDriver commands of a scraper method to a phase"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def activity_id(urn):
+    """Return the numeric activity ID of a post URN (IDs grow with the post time), or None"""
+    tail = (urn or "").rsplit(":", 1)[-1]
+    return int(tail) if tail.isdigit() else None
 
 class LinkedInScraper:
-    def __init__(self, mention, time_filter, scroll_count):
+    def __init__(self, mention, time_filter, scroll_count, extraction_mode="script",
+                 streaming=False, prune_dom=False, on_post=None, adaptive_scroll=True,
+                 scroll_timeout=10, max_idle_scrolls=3, session_file=None, user_data_dir=None,
+                 archive_dir=None, archive_page=False, seen_index=None, on_progress=None,
+                 headless=False, lean=False, driver_path=None, driver_pool=None,
+                 block_resources=False, resource_allowlist=None, search_urls=None,
+                 search_timeout=15, rate_limiter=None, action_budget=None, results_store=None,
+                 two_tier=True, relevance_pattern=None, selector_stats=None):
         """
         Initialize the scraper with parameters
         
@@ -18,57 +334,148 @@ class LinkedInScraper:
             mention (str): Company name to search for
             time_filter (int): Number of days to filter posts
             scroll_count (int): Number of times to scroll the page
+            extraction_mode (str): "script" reads all posts in one injected script call,
+                "snapshot" parses the page source once with BeautifulSoup,
+                "elements" queries each field through WebDriver
+            streaming (bool): Extract newly appeared posts after every scroll instead of
+                once at the end
+            prune_dom (bool): In streaming mode, empty already processed post nodes so
+                each scroll iteration costs about the same
+            on_post (callable): Called with each record as soon as it is extracted
+            adaptive_scroll (bool): Wait for the feed to grow instead of sleeping a fixed
+                5 seconds per scroll, and stop early once the feed is exhausted or the
+                newly loaded posts are all outside the time window; search results are
+                then sorted by date, so older posts cannot hide newer ones
+            scroll_timeout (int): Seconds to wait for new posts after an adaptive scroll
+            max_idle_scrolls (int): Consecutive scrolls without growth before the feed
+                is considered exhausted
+            session_file (str): JSON file where cookies and local storage of a logged-in
+                session are saved and restored, so later runs skip the manual login
+            user_data_dir (str): Chrome profile directory to reuse between runs
+            archive_dir (str): Directory of a SnapshotArchive that keeps the raw HTML of
+                every post, so a run can be reprocessed without scraping again
+            archive_page (bool): Also archive the full page source after scrolling
+            seen_index (str): SQLite file of posts exported by earlier runs; known posts
+                are dropped before expansion and full reads, so exports only contain
+                new posts
+            on_progress (callable): Called with a progress event dict for every phase
+                change, scroll and extracted post
+            headless (bool): Run Chrome without a window; needs a valid session_file or
+                user_data_dir, since the manual login cannot be done
+            lean (bool): Block images and media and use the eager page-load strategy
+            driver_path (str): chromedriver to use instead of the cached automatic lookup
+            driver_pool (DriverPool): Take a pre-started browser from this pool and
+                return it on close instead of quitting it; the pool's own options
+                replace headless, lean, driver_path and user_data_dir
+            block_resources (bool or list): Block requests for images, media, fonts and
+                tracking hosts at the network level; a list selects the categories
+                of network_filter.BLOCK_CATEGORIES
+            resource_allowlist (list): Hosts or URL fragments that are never blocked
+            search_urls (list): Search URL templates with a {mention} placeholder,
+                most preferred first (defaults to SEARCH_URL_TEMPLATES); they are
+                loaded side by side in separate tabs
+            search_timeout (int): Seconds to wait for the search tabs to show results
+            rate_limiter (TokenBucket): Page-action rate limit shared with other scrapers
+            action_budget (int): Maximum page actions (navigations and scrolls) of this
+                scraper's session; PacingError is raised once it is used up
+            results_store (str): SQLite file where every extracted post is stored with
+                its full text, searchable across runs
+            two_tier (bool): In script and streaming extraction, first preview every
+                post (URN, time and collapsed text) and expand and fully read only the
+                posts that are new, inside the time window and relevant
+            relevance_pattern (str or list): Case-insensitive regex, or list of keywords,
+                a post's text must match to be kept; in two-tier extraction it is
+                applied to the preview text before expansion
+            selector_stats (str): SQLite file of per-selector hit rates and lookup
+                times; selectors that keep missing are then tried last
         """
         self.mention = mention
         self.time_filter = time_filter
         self.scroll_count = scroll_count
+        self.extraction_mode = extraction_mode
+        self.streaming = streaming
+        self.prune_dom = prune_dom
+        self.on_post = on_post
+        self.on_progress = on_progress
+        self.adaptive_scroll = adaptive_scroll
+        self.scroll_timeout = scroll_timeout
+        self.max_idle_scrolls = max_idle_scrolls
+        self.scroll_stats = {}
+        self.session_file = session_file
+        self.user_data_dir = user_data_dir
+        self.archive_dir = archive_dir
+        self.headless = headless
+        self.lean = lean
+        self.driver_path = driver_path
+        self.driver_pool = driver_pool
+        if block_resources is True:
+            block_resources = DEFAULT_BLOCKED_CATEGORIES
+        self.search_urls = search_urls or SEARCH_URL_TEMPLATES
+        self.search_timeout = search_timeout
+        self.blocked_patterns = blocked_url_patterns(block_resources, resource_allowlist) if block_resources else []
+        self.archive_page = archive_page
+        self.archive_fragments = {}
+        self.run_started_at = None
+        self.seen_index = SeenIndex(seen_index) if seen_index else None
+        self.results_store = ResultsStore(results_store) if results_store else None
+        self.two_tier = two_tier and (streaming or extraction_mode == "script")
+        if isinstance(relevance_pattern, (list, tuple)):
+            relevance_pattern = "|".join(re.escape(keyword) for keyword in relevance_pattern)
+        self.relevance_re = re.compile(relevance_pattern, re.IGNORECASE) if relevance_pattern else None
+        self.extraction_stats = {"previewed": 0, "deep_read": 0}
+        self.high_water_mark = None
+        self.newest_post = None
+        self.selector_stats = SelectorStats(selector_stats) if selector_stats else None
+        self.known_keys = set()
+        self.known_on_page = set()
+        self.new_keys = []
+        self.metrics = Instrumentation()
+        self.pacer = Pacer(bucket=rate_limiter, action_budget=action_budget, sleep=self.metrics.sleep)
         self.driver = None
         self.posts_data = []
+        self.seen_keys = set()
         
+    @instrumented("setup_driver")
     def setup_driver(self):
         """Set up the Chrome WebDriver"""
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-    def expand_see_more_sections(self):
-        """Expand all 'See more' sections on the current page"""
-        see_more_selectors = [
-            "button[aria-label*='see more']",
-            "button[aria-label*='See more']",
-            "button.feed-shared-inline-show-more-text__see-more-less-toggle",
-            "button[data-tracking-control-name='public_post_feed-text-see-more']",
-            ".feed-shared-text__see-more",
-            "span.feed-shared-text__see-more-link",
-            "[aria-expanded='false']"
-        ]
-        
-        expanded_count = 0
-        for selector in see_more_selectors:
-            try:
-                see_more_buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for button in see_more_buttons:
-                    try:
-                        if button.is_displayed() and button.is_enabled():
-                            self.driver.execute_script("arguments[0].click();", button)
-                            expanded_count += 1
-                            time.sleep(0.5)
-                    except:
-                        continue
-            except:
-                continue
+        if self.driver_pool:
+            driver = self.driver_pool.acquire()
+        else:
+            driver = create_driver(self.headless, self.lean, self.user_data_dir,
+                                   self.driver_path, metrics=self.metrics)
+        self.driver = self.metrics.attach(driver)
+        if self.blocked_patterns:
+            install_request_filter(self.driver, self.blocked_patterns)
+        
+    @instrumented("expand")
+    def expand_see_more_sections(self, post_ids=None):
+        """
+        Expand the 'See more' sections on the current page in a single script call
+        
+        Args:
+            post_ids (list): Only expand inside the posts with these data-scraper-id
+                values (the survivors of a two-tier preview)
+        """
+        try:
+            result = self.driver.execute_script(
+                EXPAND_SEE_MORE_SCRIPT, self._selectors("see_more", SEE_MORE_SELECTORS),
+                None, list(self.known_on_page), post_ids) or {}
+            self._record_selectors(result)
+            expanded_count = result.get("count", 0)
+        except Exception as e:
+            print(f"Could not expand 'See more' sections: {e}")
+            expanded_count = 0
         
         print(f"Expanded {expanded_count} 'See more' sections")
         return expanded_count
     
+    @instrumented("login")
     def login(self):
-        """Open LinkedIn login page and wait for manual login"""
+        """Reuse a saved session if it is still valid, otherwise wait for manual login"""
+        if self.restore_session():
+            print("\nRestored saved LinkedIn session")
+            return
+        
         print("\nOpening LinkedIn login page...")
         self.driver.get("https://www.linkedin.com/login")
         
@@ -79,92 +486,605 @@ class LinkedInScraper:
         start_time = time.time()
         
         while not logged_in and (time.time() - start_time) < max_wait_time:
-            time.sleep(5)
-            
-            # Check if user is logged in by looking for feed or home URL
-            current_url = self.driver.current_url
-            if 'feed' in current_url or 'mynetwork' in current_url or 'jobs' in current_url:
-                logged_in = True
-                print("Login detected!")
-                break
+            self.metrics.sleep(5)
             
-            # Also check for feed elements
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, '.global-nav')
+            if self._is_logged_in():
                 logged_in = True
                 print("Login detected!")
                 break
-            except:
-                pass
         
         if not logged_in:
             raise Exception("Login timeout - please login within 5 minutes")
+        
+        self.save_session()
+    
+    def _is_logged_in(self):
+        """Check the current page for signs of a logged-in session"""
+        current_url = self.driver.current_url
+        if any(k in current_url for k in ['login', 'authwall', 'checkpoint', 'signup']):
+            return False
+        
+        # Check if user is logged in by looking for feed or home URL
+        if 'feed' in current_url or 'mynetwork' in current_url or 'jobs' in current_url:
+            return True
+        
+        # Also check for feed elements
+        try:
+            self.driver.find_element(By.CSS_SELECTOR, '.global-nav')
+            return True
+        except:
+            return False
     
+    def restore_session(self):
+        """
+        Restore a saved session and validate it with a single navigation
+        
+        Returns:
+            bool: True if the browser is logged in afterwards
+        """
+        if self.session_file and os.path.exists(self.session_file):
+            try:
+                with open(self.session_file, encoding='utf-8') as f:
+                    session = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Could not read session file: {e}")
+                return False
+            
+            # Cookies can only be set for the domain that is currently open
+            self.driver.get("https://www.linkedin.com/robots.txt")
+            for cookie in session.get("cookies", []):
+                cookie.pop("sameSite", None)
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            self.driver.execute_script(
+                "for (const [k, v] of Object.entries(arguments[0])) window.localStorage.setItem(k, v);",
+                session.get("local_storage", {}))
+        elif not self.user_data_dir:
+            return False
+        
+        self.driver.get("https://www.linkedin.com/feed/")
+        if self._is_logged_in():
+            return True
+        
+        print("Saved session is stale, falling back to manual login")
+        return False
+    
+    def save_session(self):
+        """Save cookies and local storage of the logged-in session to session_file"""
+        if not self.session_file:
+            return
+        
+        session = {
+            "saved_at": datetime.now().isoformat(timespec='seconds'),
+            "cookies": self.driver.get_cookies(),
+            "local_storage": self.driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+        }
+        
+        directory = os.path.dirname(os.path.abspath(self.session_file))
+        os.makedirs(directory, exist_ok=True)
+        
+        # Write atomically and owner-readable only: the file grants account access
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(session, f)
+        os.replace(tmp_path, self.session_file)
+        print(f"Saved LinkedIn session to {self.session_file}")
+    
+    @instrumented("search")
     def search_mentions(self):
         """Search for company mentions on LinkedIn"""
         print(f"\nSearching for mentions: @{self.mention}")
         
-        search_urls = [
-            f"https://www.linkedin.com/search/results/content/?keywords=%22%40{self.mention}%22&origin=SWITCH_SEARCH_VERTICAL",
-            f"https://www.linkedin.com/search/results/content/?keywords=%40{self.mention}&searchId=&origin=SWITCH_SEARCH_VERTICAL",
-            f"https://www.linkedin.com/search/results/all/?keywords=%40{self.mention}&origin=GLOBAL_SEARCH_HEADER"
-        ]
+        search_urls = self._search_urls()
         
-        success = False
-        for search_url in search_urls:
-            try:
-                self.driver.get(search_url)
-                time.sleep(3)
-                
-                if "No results" not in self.driver.page_source and "0 results" not in self.driver.page_source:
-                    print(f"Successfully found results")
-                    success = True
-                    break
-            except:
-                continue
+        while not self._probe_search_urls(search_urls):
+            # No results can also mean LinkedIn is throttling the session
+            reason = self.pacer.detect_throttle(self.driver)
+            if not reason:
+                print("Warning: May not have found optimal search results. Proceeding...")
+                return
+            self.pacer.backoff(reason)
         
-        if not success:
-            print("Warning: May not have found optimal search results. Proceeding...")
+        print(f"Successfully found results")
+        self.pacer.recover()
+    
+    def _search_urls(self):
+        """Build the search URLs of the current mention, newest posts first when scrolling can stop early"""
+        search_urls = [template.format(mention=quote(self.mention, safe="")) for template in self.search_urls]
+        if self.adaptive_scroll or self.high_water_mark:
+            search_urls = [url if "sortBy=" in url else f"{url}&{DATE_SORT_PARAMETER}" for url in search_urls]
+        return search_urls
+    
+    def _probe_search_urls(self, search_urls):
+        """
+        Load the search URLs side by side and keep the tab of the best one
+        
+        Returns:
+            bool: Whether the kept tab shows results
+        """
+        started = time.time()
         
-        # Try to click on "Posts" filter
+        # Every candidate loads at the same time in its own tab. Network filters
+        # belong to the tab they were installed in, so each tab opens blank, gets
+        # the filter and only then starts loading (without waiting for the load).
+        main_tab = self.driver.current_window_handle
+        tabs = [main_tab]
+        for search_url in search_urls[1:]:
+            self.pacer.action("search")
+            known = set(self.driver.window_handles)
+            self.driver.execute_script("window.open('about:blank', '_blank');")
+            opened = [handle for handle in self.driver.window_handles if handle not in known]
+            if not opened:
+                continue
+            self.driver.switch_to.window(opened[0])
+            if self.blocked_patterns:
+                install_request_filter(self.driver, self.blocked_patterns)
+            self.driver.execute_script("window.location.href = arguments[0];", search_url)
+            tabs.append(opened[0])
+        self.driver.switch_to.window(main_tab)
+        self.pacer.action("search")
+        self.driver.get(search_urls[0])
+        
+        states = {}
         try:
-            posts_filter = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Posts') or contains(text(), 'posts')]")
-            if posts_filter:
-                posts_filter.click()
-                time.sleep(2)
-        except:
-            pass
+            winner = WebDriverWait(self.driver, self.search_timeout, poll_frequency=0.3).until(
+                lambda driver: self._pick_search_tab(tabs, states))
+        except TimeoutException:
+            # Fall back to the most preferred tab that has results, if any
+            winner = next((tab for tab in tabs if states.get(tab) == "results"), main_tab)
+        
+        found = states.get(winner) == "results"
+        if found:
+            self.pacer.observe("search", time.time() - started)
+        
+        for tab in tabs:
+            if tab != winner:
+                self.driver.switch_to.window(tab)
+                self.driver.close()
+        self.driver.switch_to.window(winner)
+        return found
+    
+    def _pick_search_tab(self, tabs, states):
+        """
+        Check the search tabs that have not finished loading
+        
+        Args:
+            tabs (list): Window handles, most preferred first
+            states (dict): Last seen state per handle, updated in place
+        
+        Returns:
+            str: The most preferred tab with results once every more preferred tab
+                is known to be empty (the first tab if all are empty), otherwise
+                None to keep waiting
+        """
+        for tab in tabs:
+            if states.get(tab) not in ("results", "empty"):
+                try:
+                    self.driver.switch_to.window(tab)
+                    states[tab] = self.driver.execute_script(
+                        SEARCH_STATE_SCRIPT, SEARCH_RESULT_SELECTORS, SEARCH_EMPTY_SELECTORS)
+                except WebDriverException:
+                    states[tab] = "loading"
+            if states[tab] == "results":
+                return tab
+            if states[tab] != "empty":
+                return None
+        return tabs[0]
     
+    @instrumented("scroll")
     def scroll_and_load(self):
         """Scroll the page to load more posts"""
-        print(f"\nScrolling to load posts ({self.scroll_count} times)...")
+        print(f"\nScrolling to load posts (up to {self.scroll_count} times)...")
+        
+        for _ in self._scroll_pages():
+            pass
+        
+        # Final expansion
+        if not self.two_tier:
+            print("\nFinal expansion of all 'See more' sections...")
+            self.expand_see_more_sections()
+        if not self.adaptive_scroll:
+            self.pacer.pause("settle")
+    
+    def _scroll_pages(self):
+        """Scroll up to scroll_count times, yielding the scroll index after each scroll"""
+        if not self.adaptive_scroll:
+            for i in range(self.scroll_count):
+                with self.metrics.phase("scroll"):
+                    self.pacer.action("scroll")
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    print(f"Scroll {i+1}/{self.scroll_count}")
+                    self.report_scroll(i)
+                    
+                    if not self.two_tier:
+                        self.expand_see_more_sections()
+                    self.pacer.pause("scroll")
+                yield i
+            return
+        
+        with self.metrics.phase("scroll"):
+            self.driver.set_script_timeout(self.scroll_timeout + 5)
+        self.begin_scrolling()
         
         for i in range(self.scroll_count):
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            print(f"Scroll {i+1}/{self.scroll_count}")
+            with self.metrics.phase("scroll"):
+                self.pacer.action("scroll")
+                scroll_started = time.time()
+                state = self.driver.execute_async_script(
+                    SCROLL_AND_WAIT_SCRIPT, self._selectors("post", POST_SELECTORS), TIME_KEYWORDS,
+                    self.scroll_timeout * 1000, SCROLL_SETTLE_MS) or {}
+                print(f"Scroll {i+1}/{self.scroll_count} ({state.get('count', 0)} posts loaded)")
+                self.report_scroll(i, state.get('count', 0))
+                
+                if not self.two_tier:
+                    self.expand_see_more_sections()
+            yield i
             
-            self.expand_see_more_sections()
-            time.sleep(5)
+            # A feed that stops growing may be throttled rather than exhausted
+            reason = None if state.get("grew") else self.pacer.detect_throttle(self.driver)
+            if reason:
+                self.pacer.backoff(reason)
+            if self.after_scroll(state, time.time() - scroll_started, throttled=bool(reason)):
+                break
+        
+        self.finish_scrolling()
+    
+    def begin_scrolling(self):
+        """Reset the counters of an adaptive scroll loop; shared with the async engine"""
+        self._scroll_started = time.time()
+        self._scrolls = 0
+        self._idle_scrolls = 0
+        self._stop_reason = "scroll limit reached"
+    
+    def after_scroll(self, state, scroll_seconds, throttled=False):
+        """
+        Count an adaptive scroll and decide whether to keep scrolling
+        
+        Args:
+            state (dict): Result of the scroll-and-wait script (grew, newTimeTexts, newUrns)
+            scroll_seconds (float): Time the scroll took to settle
+            throttled (bool): The feed did not grow because of throttling, which was backed off from
+        
+        Returns:
+            bool: True when scrolling should stop
+        """
+        self._scrolls += 1
+        if throttled:
+            return False
+        if not state.get("grew"):
+            self._idle_scrolls += 1
+            if self._idle_scrolls >= self.max_idle_scrolls:
+                self._stop_reason = "feed exhausted"
+                return True
+            return False
+        self._idle_scrolls = 0
+        self.pacer.observe("scroll", scroll_seconds)
+        self.pacer.recover()
+        
+        if self._all_outside_window(state.get("newTimeTexts") or []):
+            self._stop_reason = "newly loaded posts are older than the time window"
+            return True
+        if self._reached_high_water_mark(state.get("newUrns") or [], state.get("newTimeTexts") or []):
+            self._stop_reason = "reached the posts collected by the previous run"
+            return True
+        return False
+    
+    def finish_scrolling(self):
+        """Record the scroll_stats of an adaptive scroll loop"""
+        elapsed = time.time() - self._scroll_started
+        self.scroll_stats = {
+            "scrolls": self._scrolls,
+            "scrolls_saved": self.scroll_count - self._scrolls,
+            "seconds": round(elapsed, 1),
+            "seconds_saved": round(max(self.scroll_count * 5 - elapsed, 0), 1),
+            "stop_reason": self._stop_reason,
+            "pacing": self.pacer.stats()
+        }
+        print(f"Stopped scrolling after {self._scrolls} scrolls ({self._stop_reason}); "
+              f"saved {self.scroll_stats['scrolls_saved']} scrolls and "
+              f"{self.scroll_stats['seconds_saved']} seconds")
+    
+    def report_scroll(self, i, posts_loaded=None):
+        # Scrolling covers the 10-80% range of the progress bar
+        self._report_phase("scroll", 10 + 70 * (i + 1) / self.scroll_count,
+                           f"Scroll {i+1}/{self.scroll_count}", scroll=i + 1,
+                           max_scrolls=self.scroll_count, posts_loaded=posts_loaded)
+    
+    def _all_outside_window(self, time_texts):
+        """Return True if every parseable time text is older than the time window"""
+        post_dates = [self.parse_date(t.lower().strip()) for t in time_texts if t]
+        post_dates = [d for d in post_dates if d]
+        if not post_dates:
+            return False
+        return all(self.reference_time - d > timedelta(days=self.time_filter) for d in post_dates)
+    
+    def _reached_high_water_mark(self, urns, time_texts):
+        """
+        Return True if newly loaded posts are at or below the run's high-water mark
+        
+        The mark is the newest post of the previous run. A loaded post with the
+        mark's URN or an older activity ID, or newly loaded posts that are all
+        dated before the mark, mean the rest of the feed was collected already.
+        """
+        mark = self.high_water_mark
+        if not mark:
+            return False
+        
+        mark_urn = mark.get("urn")
+        mark_id = activity_id(mark_urn)
+        for urn in urns:
+            if urn == mark_urn:
+                return True
+            post_id = activity_id(urn)
+            if mark_id is not None and post_id is not None and post_id <= mark_id:
+                return True
+        
+        if mark.get("date"):
+            post_dates = [self.parse_date(t.lower().strip()) for t in time_texts if t]
+            post_dates = [d.strftime('%Y-%m-%d') for d in post_dates if d]
+            if post_dates and all(d < mark["date"] for d in post_dates):
+                return True
+        return False
+    
+    def stream_posts(self):
+        """
+        Scroll the page and yield posts as they appear
+        
+        After every scroll only the posts that were not seen before (keyed by
+        data-urn) are extracted, so the cost of an iteration does not grow with
+        the number of posts already loaded.
+        
+        Yields:
+            dict: One record per new post inside the time window
+        """
+        print(f"\nScrolling and streaming posts (up to {self.scroll_count} times)...")
+        
+        for _ in self._scroll_pages():
+            yield from self._extract_new_posts()
         
         # Final expansion
-        print("\nFinal expansion of all 'See more' sections...")
-        self.expand_see_more_sections()
-        time.sleep(3)
+        if not self.two_tier:
+            print("\nFinal expansion of all 'See more' sections...")
+            self.expand_see_more_sections()
+        if not self.adaptive_scroll:
+            self.pacer.pause("settle")
+        
+        yield from self._extract_new_posts()
+    
+    @instrumented("extract")
+    def _extract_new_posts(self):
+        """Extract only the posts that appeared since the previous call"""
+        options = {"onlyNew": True, "prune": self.prune_dom, "includeHtml": bool(self.archive_dir)}
+        result = self._read_posts(options)
+        payload = result.get("posts") or []
+        self._collect_fragments(payload)
+        return self._process_payload(payload)
     
+    @instrumented("extract")
     def extract_posts(self):
-        """Extract post data from the page"""
+        """Extract post data from the page using the configured extraction mode"""
         print("\nExtracting posts data...")
+        self._report_phase("extract", 85, "Extracting posts...")
+        
+        # Catch toggles rendered after the last scroll; already expanded ones are skipped
+        if not self.two_tier:
+            self.expand_see_more_sections()
         
-        post_selectors = [
-            '[data-urn*="urn:li:activity"]',
-            '.feed-shared-update-v2',
-            '.update-components-actor',
-            'article'
-        ]
+        if self.extraction_mode == "elements":
+            return self._extract_posts_elements()
+        if self.extraction_mode == "snapshot":
+            return self.extract_posts_from_html(self.driver.page_source)
+        return self._extract_posts_script()
+    
+    @instrumented("extract")
+    def extract_posts_from_html(self, html):
+        """
+        Extract post data from an HTML snapshot without further browser calls
+        
+        Args:
+            html (str): Page source captured after scrolling, or a saved HTML file's content
+        
+        Returns:
+            list: The extracted post records
+        """
+        from snapshot_parser import parse_posts_payload
+        
+        result = parse_posts_payload(html)
+        payload = result["posts"]
+        
+        if not payload:
+            print("No posts found with any selector")
+            return []
+        
+        print(f"Found {len(payload)} posts using selector: {result['selector']}")
+        print(f"Processing {len(payload)} posts...")
+        
+        self._process_payload(payload)
+        return self.posts_data
+    
+    def _extract_posts_script(self):
+        """Extract every post in a single injected script call"""
+        options = {"includeHtml": bool(self.archive_dir)}
+        result = self._read_posts(options)
+        payload = result.get("posts") or []
+        self._collect_fragments(payload)
+        
+        if result.get("skipped"):
+            print(f"Skipped {result['skipped']} posts already exported by earlier runs")
+        if self.two_tier:
+            print(f"Previewed {self.extraction_stats['previewed']} posts, "
+                  f"{self.extraction_stats['deep_read']} expanded and read in full")
+        
+        if not payload:
+            print("No new posts found" if result.get("skipped") else "No posts found with any selector")
+            return self.posts_data
+        
+        print(f"Found {len(payload)} posts using selector: {result.get('selector')}")
+        print(f"Processing {len(payload)} posts...")
+        
+        self._process_payload(payload)
+        return self.posts_data
+    
+    def _read_posts(self, options):
+        """
+        Run EXTRACT_POSTS_SCRIPT with the given options
+        
+        With two-tier extraction the first call is only a preview. Posts that
+        are known, outside the time window or irrelevant are dropped there, and
+        only the rest are expanded and read again in full. When archiving, the
+        preview HTML of every post is kept, so posts dropped because their time
+        text no longer parses can still be recovered from the archive.
+        
+        Returns:
+            dict: The script result, holding only the posts worth processing
+        """
+        if not self.two_tier:
+            return self.drop_known(self._run_extract_script(options))
+        
+        result = self.drop_known(self._run_extract_script(dict(options, tagIds=True)))
+        self._collect_fragments(result.get("posts") or [])
+        candidates = self._preview_candidates(result.get("posts") or [])
+        if candidates:
+            ids = [item["id"] for item in candidates]
+            self.expand_see_more_sections(ids)
+            deep = self._run_extract_script({"ids": ids, "includeHtml": options.get("includeHtml", False)})
+            candidates = self._merge_deep(candidates, deep.get("posts") or [])
+        return dict(result, posts=candidates)
+    
+    def _run_extract_script(self, options):
+        """Run EXTRACT_POSTS_SCRIPT once with the selectors in their learned order"""
+        result = self.driver.execute_script(EXTRACT_POSTS_SCRIPT, self._selectors("post", POST_SELECTORS),
+                                            self._selectors("text", TEXT_SELECTORS), TIME_KEYWORDS, options) or {}
+        self._record_selectors(result)
+        return result
+    
+    def _selectors(self, group, selectors):
+        """Return a selector group in the order learned by selector_stats, or as given"""
+        if not self.selector_stats:
+            return selectors
+        return self.selector_stats.order(group, selectors)
+    
+    def _record_selectors(self, result):
+        """Count the selector lookups reported by an injected script"""
+        if self.selector_stats and isinstance(result, dict):
+            self.selector_stats.record_many(result.get("selectorStats"))
+    
+    def _record_lookup(self, group, selector, hit, started):
+        """Count one WebDriver selector lookup that began at the perf_counter value started"""
+        if self.selector_stats:
+            self.selector_stats.record(group, selector, hit, time.perf_counter() - started)
+    
+    def drop_known(self, result):
+        """
+        Remove the posts exported by earlier runs from an extraction result
+        
+        Known posts are filtered here rather than in the script, so each call
+        does not ship the whole seen index to the page. Their URNs are kept in
+        known_on_page, which later 'See more' expansions skip.
+        
+        Args:
+            result (dict): Result of EXTRACT_POSTS_SCRIPT
         
+        Returns:
+            dict: The result without known posts, with their number as skipped
+        """
+        posts = result.get("posts") or []
+        fresh = []
+        for item in posts:
+            if (item.get("urn") or item.get("link")) in self.known_keys:
+                if item.get("urn"):
+                    self.known_on_page.add(item["urn"])
+            else:
+                fresh.append(item)
+        return dict(result, posts=fresh, skipped=len(posts) - len(fresh))
+    
+    def _preview_candidates(self, preview):
+        """Keep the previewed posts worth a full read: new, inside the time window and relevant"""
+        candidates = []
+        for item in preview:
+            if (item.get("urn") or item.get("link")) in self.known_keys:
+                continue
+            if not self._post_date_in_window((item.get("timeText") or "").lower().strip()):
+                continue
+            if not self._is_relevant(item.get("text")):
+                continue
+            candidates.append(item)
+        
+        self.extraction_stats["previewed"] += len(preview)
+        self.extraction_stats["deep_read"] += len(candidates)
+        return candidates
+    
+    @staticmethod
+    def _merge_deep(candidates, deep):
+        """Replace the preview fields of each candidate with its full read, matched by id"""
+        deep_by_id = {item.get("id"): item for item in deep}
+        return [dict(item, **deep_by_id.get(item["id"], {})) for item in candidates]
+    
+    def _is_relevant(self, text):
+        """Return True if the text matches relevance_pattern, or no pattern is set"""
+        return self.relevance_re is None or bool(self.relevance_re.search(text or ""))
+    
+    def _process_payload(self, payload):
+        """
+        Turn the raw post payload of EXTRACT_POSTS_SCRIPT into records
+        
+        Args:
+            payload (list): Dicts with urn, text, timeText and link keys
+        
+        Returns:
+            list: The records added to the results
+        """
+        records = []
+        for i, item in enumerate(payload):
+            post_started = time.perf_counter()
+            try:
+                if (item.get("urn") or item.get("link")) in self.known_keys:
+                    continue
+                
+                time_text = (item.get("timeText") or "").lower().strip()
+                if not time_text:
+                    continue
+                
+                post_date = self._post_date_in_window(time_text)
+                if not post_date:
+                    continue
+                
+                post_urn = item.get("urn")
+                if post_urn:
+                    post_link = f"https://www.linkedin.com/feed/update/{post_urn.split(':')[-1]}"
+                else:
+                    post_link = item.get("link") or ""
+                
+                if not post_link:
+                    continue
+                
+                post_text = (item.get("text") or "").strip()
+                if not self._is_relevant(post_text):
+                    continue
+                
+                record = self._add_record(post_date, post_link, time_text, post_text, post_urn)
+                if record:
+                    records.append(record)
+                
+            except Exception as e:
+                print(f"Error processing post {i+1}: {str(e)}")
+                continue
+            finally:
+                self.metrics.observe_post(time.perf_counter() - post_started)
+        
+        if self.results_store:
+            self.results_store.flush()
+        return records
+    
+    def _extract_posts_elements(self):
+        """Extract post data with one WebDriver lookup per field (legacy mode)"""
         posts = []
-        for selector in post_selectors:
+        for selector in self._selectors("post", POST_SELECTORS):
+            lookup_started = time.perf_counter()
             posts = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            self._record_lookup("post", selector, bool(posts), lookup_started)
             if posts:
                 print(f"Found {len(posts)} posts using selector: {selector}")
                 break
@@ -174,37 +1094,28 @@ class LinkedInScraper:
             return []
         
         print(f"Processing {len(posts)} posts...")
+        text_selectors = self._selectors("text", TEXT_SELECTORS)
         
         for i, post in enumerate(posts):
+            post_started = time.perf_counter()
             try:
-                # Expand see more in individual posts
-                try:
-                    see_more_in_post = post.find_elements(By.CSS_SELECTOR, 
-                        "button[aria-label*='see more'], .feed-shared-text__see-more, button.feed-shared-inline-show-more-text__see-more-less-toggle")
-                    for btn in see_more_in_post:
-                        if btn.is_displayed() and btn.is_enabled():
-                            self.driver.execute_script("arguments[0].click();", btn)
-                            time.sleep(0.5)
-                except:
-                    pass
+                # Skip posts exported by earlier runs before reading anything else
+                post_urn = post.get_attribute("data-urn")
+                if post_urn and post_urn in self.known_keys:
+                    continue
                 
                 # Extract post text
                 post_text = ""
-                text_selectors = [
-                    ".feed-shared-text__text-view",
-                    ".feed-shared-update-v2__description",
-                    ".update-components-text",
-                    ".feed-shared-text",
-                    "[data-test-id='main-feed-activity-card'] .break-words"
-                ]
-                
                 for text_selector in text_selectors:
+                    lookup_started = time.perf_counter()
                     try:
                         text_element = post.find_element(By.CSS_SELECTOR, text_selector)
+                        self._record_lookup("text", text_selector, True, lookup_started)
                         post_text = text_element.text.strip()
                         if post_text:
                             break
                     except:
+                        self._record_lookup("text", text_selector, False, lookup_started)
                         continue
                 
                 # Extract time text
@@ -214,24 +1125,19 @@ class LinkedInScraper:
                     time_text = time_elem.text.lower().strip()
                 except:
                     for t in post.find_elements(By.CSS_SELECTOR, "time, .visually-hidden"):
-                        if t.text and any(k in t.text.lower() for k in ["ago", "h", "d", "w", "week", "day"]):
+                        if t.text and any(k in t.text.lower() for k in TIME_KEYWORDS):
                             time_text = t.text.lower().strip()
                             break
                 
                 if not time_text:
                     continue
                 
-                # Parse date
-                post_date = self.parse_date(time_text)
+                # Parse date and filter by time window
+                post_date = self._post_date_in_window(time_text)
                 if not post_date:
                     continue
                 
-                # Filter by time window
-                if datetime.today() - post_date > timedelta(days=self.time_filter):
-                    continue
-                
                 # Extract post URL
-                post_urn = post.get_attribute("data-urn")
                 if post_urn:
                     post_link = f"https://www.linkedin.com/feed/update/{post_urn.split(':')[-1]}"
                 else:
@@ -242,67 +1148,220 @@ class LinkedInScraper:
                             post_link = href
                             break
                 
-                if not post_link:
+                if not post_link or post_link in self.known_keys:
                     continue
                 
-                # Extract emails
-                found_emails = re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", post_text)
-                emails_str = ", ".join(found_emails) if found_emails else ""
-                
-                # Add to results
-                self.posts_data.append({
-                    "Post Date": post_date.strftime('%Y-%m-%d'),
-                    "Post Link": post_link,
-                    "Time Text": time_text,
-                    "Post Text": post_text[:500] + "..." if len(post_text) > 500 else post_text,
-                    "Emails Found": emails_str
-                })
+                if not self._is_relevant(post_text):
+                    continue
                 
-                print(f"Found post {len(self.posts_data)}: {post_date.strftime('%Y-%m-%d')} — {post_link}")
+                self._add_record(post_date, post_link, time_text, post_text, post_urn)
                 
             except Exception as e:
                 print(f"Error processing post {i+1}: {str(e)}")
                 continue
+            finally:
+                self.metrics.observe_post(time.perf_counter() - post_started)
         
         return self.posts_data
     
+    def _post_date_in_window(self, time_text):
+        """Return the parsed post date, or None if unparseable or outside the time window"""
+        post_date = self.parse_date(time_text)
+        if not post_date:
+            return None
+        
+        if self.reference_time - post_date > timedelta(days=self.time_filter):
+            return None
+        
+        return post_date
+    
+    def _add_record(self, post_date, post_link, time_text, post_text, post_urn=None):
+        """Build an output record and append it to the results, skipping links already seen"""
+        if post_link in self.seen_keys:
+            return None
+        self.seen_keys.add(post_link)
+        self.new_keys.append(post_urn or post_link)
+        self._track_newest(post_date, post_urn)
+        
+        record = {
+            "Post Date": post_date.strftime('%Y-%m-%d'),
+            "Post Link": post_link,
+            "Time Text": time_text,
+            "Post Text": post_text[:500] + "..." if len(post_text) > 500 else post_text
+        }
+        # Contacts come from the full text, not the truncated export column
+        record.update(contact_columns(post_text))
+        self.posts_data.append(record)
+        if self.results_store:
+            self.results_store.add(self.mention, record, post_text, post_urn)
+        
+        print(f"Found post {len(self.posts_data)}: {post_date.strftime('%Y-%m-%d')} — {post_link}")
+        
+        if self.on_post:
+            self.on_post(record)
+        self._report("post", record=record, posts=len(self.posts_data))
+        return record
+    
+    def _track_newest(self, post_date, post_urn):
+        """Remember the newest post of the run; it becomes the next run's high-water mark"""
+        if not post_urn:
+            return
+        candidate = {"urn": post_urn, "date": post_date.strftime('%Y-%m-%d')}
+        newest = self.newest_post
+        if newest is None or (candidate["date"], activity_id(post_urn) or 0) > \
+                (newest["date"], activity_id(newest["urn"]) or 0):
+            self.newest_post = candidate
+    
+    @property
+    def reference_time(self):
+        """Run start time that all relative post times are resolved against"""
+        if self.run_started_at is None:
+            self.run_started_at = datetime.now()
+        return self.run_started_at
+    
     def parse_date(self, time_text):
-        """Parse date from time text"""
-        try:
-            if "minute" in time_text or "hour" in time_text:
-                return datetime.today()
-            elif "day" in time_text:
-                days = int(time_text.split("day")[0].strip())
-                return datetime.today() - timedelta(days=days)
-            elif "week" in time_text:
-                weeks = int(time_text.split("week")[0].strip())
-                return datetime.today() - timedelta(weeks=weeks)
-            elif "d" in time_text:
-                days = int(''.join(filter(str.isdigit, time_text)))
-                return datetime.today() - timedelta(days=days)
-            elif "w" in time_text:
-                weeks = int(''.join(filter(str.isdigit, time_text)))
-                return datetime.today() - timedelta(weeks=weeks)
-        except:
-            pass
-        return None
+        """Parse date from time text, relative to the start of the run"""
+        return parse_relative_time(time_text, self.reference_time)
+    
+    def _report(self, event_type, **data):
+        """Send a progress event to the on_progress callback"""
+        if self.on_progress:
+            try:
+                self.on_progress(dict(data, type=event_type))
+            except Exception as e:
+                print(f"Progress callback failed: {e}")
+    
+    def _report_phase(self, phase, progress, message, **data):
+        self._report("progress", phase=phase, progress=round(progress, 1), message=message,
+                     posts=len(self.posts_data), **data)
+    
+    def start(self):
+        """Start the browser and log in, unless a session is already open"""
+        if self.driver:
+            return
+        self._report_phase("setup", 0, "Starting browser...")
+        self.setup_driver()
+        self._report_phase("login", 5, "Waiting for LinkedIn login...")
+        self.login()
+    
+    def scrape(self, mention=None, time_filter=None, scroll_count=None, high_water_mark=None):
+        """
+        Search, scroll and extract posts using the already started browser
+        
+        The browser and its logged-in session are kept open afterwards, so one
+        scraper can serve several searches in a row.
+        
+        Args:
+            mention (str): Company name to search for (defaults to the current one)
+            time_filter (int): Number of days to filter posts (defaults to the current one)
+            scroll_count (int): Number of times to scroll the page (defaults to the current one)
+            high_water_mark (dict): urn and date of the newest post of an earlier run;
+                results are sorted by date and scrolling stops once it is reached
+        
+        Returns:
+            list: The extracted post records
+        """
+        self._begin_run(mention, time_filter, scroll_count, high_water_mark)
+        
+        self._report_phase("search", 10, f"Searching for mentions of {self.mention}...")
+        self.search_mentions()
+        if self.streaming:
+            for _ in self.stream_posts():
+                pass
+            results = self.posts_data
+        else:
+            self.scroll_and_load()
+            results = self.extract_posts()
+        
+        if self.archive_dir:
+            self.archive_snapshot()
+        
+        return self._finish_run(results)
+    
+    def _begin_run(self, mention=None, time_filter=None, scroll_count=None, high_water_mark=None):
+        """Apply the run parameters and reset the per-run state"""
+        if mention is not None:
+            self.mention = mention
+        if time_filter is not None:
+            self.time_filter = time_filter
+        if scroll_count is not None:
+            self.scroll_count = scroll_count
+        
+        self.posts_data = []
+        self.seen_keys = set()
+        self.scroll_stats = {}
+        self.extraction_stats = {"previewed": 0, "deep_read": 0}
+        self.high_water_mark = high_water_mark
+        self.newest_post = None
+        self.archive_fragments = {}
+        self.run_started_at = datetime.now()
+        self.known_keys = self.seen_index.known_keys(self.mention) if self.seen_index else set()
+        self.known_on_page = set()
+        self.new_keys = []
+    
+    def _finish_run(self, results):
+        """Record the exported posts in the seen index and report completion"""
+        if self.seen_index:
+            self.seen_index.add_many(self.mention, self.new_keys)
+        if self.results_store:
+            self.results_store.flush()
+        if self.selector_stats:
+            self.selector_stats.flush()
+        
+        self._report_phase("done", 100, f"Scraping complete! Found {len(results)} posts",
+                           scroll_stats=self.scroll_stats, extraction_stats=self.extraction_stats,
+                           newest_post=self.newest_post)
+        print(f"\nScraping complete! Found {len(results)} posts")
+        return results
+    
+    @instrumented("archive")
+    def archive_snapshot(self):
+        """
+        Save the raw HTML collected during this run to the snapshot archive
+        
+        Returns:
+            str: The archived run ID
+        """
+        from snapshot_archive import SnapshotArchive
+        
+        page_html = None
+        if self.archive_page or not self.archive_fragments:
+            page_html = self.driver.page_source
+        
+        run_id = SnapshotArchive(self.archive_dir).save_run(
+            self.mention, self.archive_fragments, page_html, self.run_started_at)
+        print(f"Archived {len(self.archive_fragments)} post snapshots as run {run_id}")
+        return run_id
+    
+    def _collect_fragments(self, payload):
+        """Keep the post HTML returned by EXTRACT_POSTS_SCRIPT for the archive"""
+        for item in payload:
+            html = item.get("html")
+            if html:
+                key = item.get("urn") or item.get("link") or f"post-{len(self.archive_fragments)}"
+                self.archive_fragments[key] = html
+    
+    def close(self):
+        """Close the browser"""
+        if self.driver:
+            try:
+                if self.driver_pool:
+                    print("\nReturning browser to the pool...")
+                    self.driver_pool.release(self.driver)
+                else:
+                    print("\nClosing browser...")
+                    self.driver.quit()
+            finally:
+                self.driver = None
     
     def run(self):
         """Main execution method"""
         try:
-            self.setup_driver()
-            self.login()
-            self.search_mentions()
-            self.scroll_and_load()
-            results = self.extract_posts()
-            
-            print(f"\nScraping complete! Found {len(results)} posts")
-            return results
+            self.start()
+            return self.scrape()
             
         except Exception as e:
             print(f"\nError during scraping: {e}")
             raise
         finally:
-            if self.driver:
-                print("\nClosing browser...")
-                self.driver.quit()
\ No newline at end of file
+            self.close()
\ No newline at end of file
@@ -0,0 +1,61 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+class SeenIndex:
+    def __init__(self, path):
+        """
+        Persistent index of posts already exported, shared across runs
+
+        Posts are keyed by their activity URN (or their link when a post has no
+        data-urn) per searched company, with the date they were first seen.
+
+        Args:
+            path (str): SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_posts (
+                mention TEXT NOT NULL,
+                post_key TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                PRIMARY KEY (mention, post_key)
+            )
+        """)
+        self._conn.commit()
+
+    def known_keys(self, mention):
+        """Return the set of post keys already seen for a company"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT post_key FROM seen_posts WHERE mention = ?", (mention.lower(),)).fetchall()
+        return {row[0] for row in rows}
+
+    def add_many(self, mention, post_keys):
+        """Record post keys as seen today; keys already present keep their first-seen date"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_posts (mention, post_key, first_seen) VALUES (?, ?, ?)",
+                [(mention.lower(), key, today) for key in post_keys])
+            self._conn.commit()
+
+    def first_seen(self, mention, post_key):
+        """Return the date a post was first seen, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_seen FROM seen_posts WHERE mention = ? AND post_key = ?",
+                (mention.lower(), post_key)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,169 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Consecutive misses after which a selector counts as dead and is tried last
+DEAD_AFTER_MISSES = 50
+
+
+class SelectorStats:
+    def __init__(self, path, dead_after=DEAD_AFTER_MISSES):
+        """
+        Persistent hit rates and lookup times of the CSS selectors, shared across runs
+
+        Selectors are grouped by purpose ("post", "text", "see_more"). Within a
+        group they keep their hand-written order, which ranks the more specific
+        selectors first, and only selectors that keep missing are demoted to the
+        end, so LinkedIn's retired markup stops costing a lookup per post. Dead
+        selectors are never dropped, so one LinkedIn brings back is still found.
+
+        Args:
+            path (str): SQLite database file
+            dead_after (int): Consecutive misses after which a selector is dead
+        """
+        self.path = path
+        self.dead_after = dead_after
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._totals = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS selector_stats (
+                selector_group TEXT NOT NULL,
+                selector TEXT NOT NULL,
+                tries INTEGER NOT NULL DEFAULT 0,
+                hits INTEGER NOT NULL DEFAULT 0,
+                total_ms REAL NOT NULL DEFAULT 0,
+                misses_since_hit INTEGER NOT NULL DEFAULT 0,
+                last_hit TEXT,
+                PRIMARY KEY (selector_group, selector)
+            )
+        """)
+        self._conn.commit()
+        self._load()
+
+    def _load(self):
+        rows = self._conn.execute("SELECT * FROM selector_stats").fetchall()
+        self._totals = {(row['selector_group'], row['selector']): dict(row) for row in rows}
+
+    def record(self, group, selector, hit, seconds):
+        """Count one lookup of a selector"""
+        self.record_many({group: {selector: {'tries': 1, 'hits': int(hit), 'ms': seconds * 1000}}})
+
+    def record_many(self, stats):
+        """
+        Count lookups reported by an injected script
+
+        Args:
+            stats (dict): {group: {selector: {"tries", "hits", "ms"}}}
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            for group, selectors in (stats or {}).items():
+                for selector, counts in selectors.items():
+                    key = (group, selector)
+                    pending = self._pending.setdefault(key, {'tries': 0, 'hits': 0, 'ms': 0.0, 'misses': 0, 'last_hit': None})
+                    hits = int(counts.get('hits', 0))
+                    pending['tries'] += int(counts.get('tries', 0))
+                    pending['hits'] += hits
+                    pending['ms'] += float(counts.get('ms', 0))
+                    if hits:
+                        # A batch with a hit ends the miss streak; misses after its last hit are not known
+                        pending['misses'] = 0
+                        pending['last_hit'] = now
+                    else:
+                        pending['misses'] += int(counts.get('tries', 0))
+
+    def _merged(self, key):
+        """Persisted totals of a selector plus its pending counts (called with the lock held)"""
+        total = self._totals.get(key, {})
+        pending = self._pending.get(key)
+        tries = total.get('tries', 0)
+        hits = total.get('hits', 0)
+        misses = total.get('misses_since_hit', 0)
+        if pending:
+            tries += pending['tries']
+            hits += pending['hits']
+            misses = pending['misses'] if pending['last_hit'] else misses + pending['misses']
+        return tries, hits, misses
+
+    def order(self, group, selectors):
+        """
+        Return the selectors of a group in their given order, with dead ones last
+
+        Hit rates are not used for ordering: the scripts stop at the first
+        selector that matches, so the ones after it are rarely tried and a
+        rate-based order would favour broad fallbacks over specific selectors.
+
+        Args:
+            group (str): Selector group
+            selectors (list): Selectors in their default order
+
+        Returns:
+            list: The selectors to try, in order
+        """
+        with self._lock:
+            dead = {selector for selector in selectors
+                    if self._merged((group, selector))[2] >= self.dead_after}
+        return [selector for selector in selectors if selector not in dead] + \
+               [selector for selector in selectors if selector in dead]
+
+    def flush(self):
+        """Write the pending counts in one transaction and reload the totals"""
+        with self._lock:
+            if self._pending:
+                with self._conn:
+                    for (group, selector), pending in self._pending.items():
+                        self._conn.execute("""
+                            INSERT INTO selector_stats (selector_group, selector, tries, hits, total_ms,
+                                                        misses_since_hit, last_hit)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT (selector_group, selector) DO UPDATE SET
+                                tries = tries + excluded.tries,
+                                hits = hits + excluded.hits,
+                                total_ms = total_ms + excluded.total_ms,
+                                misses_since_hit = CASE WHEN excluded.last_hit IS NULL
+                                    THEN misses_since_hit + excluded.misses_since_hit
+                                    ELSE excluded.misses_since_hit END,
+                                last_hit = COALESCE(excluded.last_hit, last_hit)
+                        """, (group, selector, pending['tries'], pending['hits'], pending['ms'],
+                              pending['misses'], pending['last_hit']))
+                self._pending = {}
+            self._load()
+
+    def snapshot(self):
+        """
+        Return the statistics of every selector, grouped, live ones first and best hit rate first
+
+        Returns:
+            dict: {group: [{selector, tries, hits, hit_rate, avg_ms, misses_since_hit, last_hit, dead}]}
+        """
+        self.flush()
+        groups = {}
+        with self._lock:
+            rows = sorted(self._totals.values(), key=lambda row: (row['selector_group'],
+                          row['misses_since_hit'] >= self.dead_after, -(row['hits'] + 1) / (row['tries'] + 2)))
+        for row in rows:
+            tries = row['tries']
+            groups.setdefault(row['selector_group'], []).append({
+                'selector': row['selector'],
+                'tries': tries,
+                'hits': row['hits'],
+                'hit_rate': round(row['hits'] / tries, 3) if tries else None,
+                'avg_ms': round(row['total_ms'] / tries, 3) if tries else None,
+                'misses_since_hit': row['misses_since_hit'],
+                'last_hit': row['last_hit'],
+                'dead': row['misses_since_hit'] >= self.dead_after
+            })
+        return groups
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,188 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class SnapshotArchive:
+    def __init__(self, root):
+        """
+        Compressed, content-addressed store of raw page and post HTML
+
+        Every blob is stored once under the SHA-256 of its content, so posts that
+        show up unchanged in several runs take no extra space. Blobs are
+        compressed with zstd when the zstandard package is installed, otherwise
+        with gzip. Each run writes a small JSON manifest that maps post URNs (and
+        optionally the full page) to blob hashes.
+
+        Args:
+            root (str): Archive directory
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.runs_dir = os.path.join(root, "runs")
+
+    def _object_path(self, digest, ext):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest[2:]}.{ext}")
+
+    def put(self, content):
+        """
+        Store a blob if it is not archived yet
+
+        Args:
+            content (str): HTML to store
+
+        Returns:
+            str: The content hash
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if os.path.exists(self._object_path(digest, "zst")) or os.path.exists(self._object_path(digest, "gz")):
+            return digest
+
+        if zstandard:
+            ext, compressed = "zst", zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            ext, compressed = "gz", gzip.compress(data, compresslevel=6)
+
+        path = self._object_path(digest, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest):
+        """Return the archived content for a hash"""
+        path = self._object_path(digest, "zst")
+        if os.path.exists(path):
+            if not zstandard:
+                raise RuntimeError("zstandard is required to read .zst archive objects")
+            with open(path, "rb") as f:
+                return zstandard.ZstdDecompressor().decompress(f.read()).decode("utf-8")
+
+        with open(self._object_path(digest, "gz"), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def save_run(self, mention, fragments=None, page_html=None, started_at=None):
+        """
+        Archive the raw HTML of one scrape
+
+        Args:
+            mention (str): Company name that was searched
+            fragments (dict): Post HTML keyed by data-urn
+            page_html (str): Full page source after scrolling
+            started_at (datetime): When the scrape started
+
+        Returns:
+            str: The run ID
+        """
+        started_at = started_at or datetime.now()
+        run_id = f"{started_at.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        manifest = {
+            "run_id": run_id,
+            "mention": mention,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "page": self.put(page_html) if page_html else None,
+            "posts": {urn: self.put(html) for urn, html in (fragments or {}).items()}
+        }
+
+        os.makedirs(self.runs_dir, exist_ok=True)
+        with open(os.path.join(self.runs_dir, f"{run_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return run_id
+
+    def list_runs(self):
+        """Return the manifests of all archived runs, oldest first"""
+        if not os.path.isdir(self.runs_dir):
+            return []
+        return [self.load_run(name[:-5]) for name in sorted(os.listdir(self.runs_dir)) if name.endswith(".json")]
+
+    def load_run(self, run_id):
+        """Return the manifest of one run"""
+        with open(os.path.join(self.runs_dir, f"{run_id}.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def run_html(self, run_id):
+        """
+        Rebuild one HTML document from a run
+
+        Post fragments are concatenated into a single document so the whole run
+        is parsed in one pass; the full page is used when no fragments exist.
+        """
+        manifest = self.load_run(run_id)
+        if manifest["posts"]:
+            body = "\n".join(self.get(digest) for digest in manifest["posts"].values())
+            return f"<html><body>{body}</body></html>"
+        if manifest["page"]:
+            return self.get(manifest["page"])
+        return ""
+
+
+def reprocess(archive_root, time_filter, run_ids=None):
+    """
+    Run archived HTML back through the extraction logic without a browser
+
+    Args:
+        archive_root (str): Archive directory
+        time_filter (int): Number of days to filter posts
+        run_ids (list): Runs to reprocess (defaults to all runs)
+
+    Returns:
+        list: The extracted post records of all runs
+    """
+    from scraper import LinkedInScraper
+
+    archive = SnapshotArchive(archive_root)
+    run_ids = run_ids or [manifest["run_id"] for manifest in archive.list_runs()]
+
+    # One scraper across runs so posts archived in several runs are reported once
+    scraper = LinkedInScraper(None, time_filter, 0)
+    for run_id in run_ids:
+        print(f"\nReprocessing run {run_id}...")
+        # Relative post times are resolved against the moment the run was captured
+        scraper.run_started_at = datetime.fromisoformat(archive.load_run(run_id)["started_at"])
+        scraper.extract_posts_from_html(archive.run_html(run_id))
+    return scraper.posts_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and reprocess a LinkedIn snapshot archive")
+    parser.add_argument("archive", help="Archive directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List archived runs")
+
+    reprocess_parser = subparsers.add_parser("reprocess", help="Extract posts from archived runs")
+    reprocess_parser.add_argument("--run", action="append", dest="runs", help="Run ID (repeatable, default: all)")
+    reprocess_parser.add_argument("--days", type=int, default=7, help="Number of days to filter posts")
+    reprocess_parser.add_argument("--output", help="Write the records as JSON to this file")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for manifest in SnapshotArchive(args.archive).list_runs():
+            page = "with page" if manifest["page"] else "no page"
+            print(f"{manifest['run_id']}  {manifest['mention']}  {len(manifest['posts'])} posts, {page}")
+        return
+
+    records = reprocess(args.archive, args.days, args.runs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+        print(f"\nSaved {len(records)} posts to {args.output}")
+    else:
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from scraper import LinkedInScraper, POST_SELECTORS, TEXT_SELECTORS, TIME_KEYWORDS
+
+BASE_URL = "https://www.linkedin.com/"
+
+
+def make_soup(html):
+    """Parse HTML with lxml when it is installed, otherwise with the built-in parser"""
+    try:
+        return BeautifulSoup(html, "lxml")
+    except Exception:
+        return BeautifulSoup(html, "html.parser")
+
+
+def _visible_text(element):
+    """Approximate the rendered text of an element"""
+    lines = (" ".join(line.split()) for line in element.get_text().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _has_ago_text(tag):
+    # Same as the XPath .//span[contains(text(),'ago')] used by the live extraction
+    return tag.name == "span" and any("ago" in s for s in tag.find_all(string=True, recursive=False))
+
+
+def _time_text_of(post):
+    ago = post.find(_has_ago_text)
+    if ago:
+        return _visible_text(ago)
+    for element in post.select("time, .visually-hidden"):
+        text = _visible_text(element)
+        if text and any(k in text.lower() for k in TIME_KEYWORDS):
+            return text
+    return ""
+
+
+def parse_posts_payload(html, base_url=BASE_URL):
+    """
+    Parse posts from an HTML snapshot of a search results page
+
+    Uses the same selector fallbacks as LinkedInScraper.extract_posts and returns
+    the same payload shape as EXTRACT_POSTS_SCRIPT, so the records built from it
+    are identical to a live extraction.
+
+    Args:
+        html (str): Page source or saved HTML
+        base_url (str): URL used to resolve relative post links
+
+    Returns:
+        dict: {"selector": str or None, "posts": [{"urn", "text", "timeText", "link"}]}
+    """
+    soup = make_soup(html) if isinstance(html, (str, bytes)) else html
+
+    posts = []
+    used_selector = None
+    for selector in POST_SELECTORS:
+        posts = soup.select(selector)
+        if posts:
+            used_selector = selector
+            break
+
+    payload = []
+    for post in posts:
+        text = ""
+        for text_selector in TEXT_SELECTORS:
+            element = post.select_one(text_selector)
+            if element:
+                text = _visible_text(element)
+                if text:
+                    break
+
+        link = ""
+        for anchor in post.select("a[href]"):
+            href = urljoin(base_url, anchor["href"])
+            if "activity" in href:
+                link = href
+                break
+
+        payload.append({
+            "urn": post.get("data-urn"),
+            "text": text,
+            "timeText": _time_text_of(post),
+            "link": link
+        })
+
+    return {"selector": used_selector, "posts": payload}
+
+
+def parse_snapshot_file(path, time_filter):
+    """
+    Extract post records from a saved HTML file without a browser
+
+    Args:
+        path (str): Path of the HTML snapshot
+        time_filter (int): Number of days to filter posts
+
+    Returns:
+        list: The extracted post records
+    """
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    return LinkedInScraper(None, time_filter, 0).extract_posts_from_html(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract LinkedIn posts from a saved HTML snapshot")
+    parser.add_argument("snapshot", help="Path of the saved HTML page")
+    parser.add_argument("--days", type=int, default=7, help="Number of days to filter posts")
+    parser.add_argument("--output", help="Write the records as JSON to this file instead of stdout")
+    args = parser.parse_args()
+
+    records = parse_snapshot_file(args.snapshot, args.days)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+        print(f"Saved {len(records)} posts to {args.output}")
+    else:
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()